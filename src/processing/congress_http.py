@@ -0,0 +1,92 @@
+"""
+Shared HTTP access to the Congress.gov API (https://api.congress.gov/v3/).
+
+Used by fetch_congress_api.py and fetch_hearings.py:
+- One requests session with keep-alive connection pooling
+- Retries with backoff for rate limiting (429) and server errors (5xx)
+- A token bucket that keeps requests within the hourly API quota
+"""
+import time
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Optional
+
+# Rate limiting: API allows 1000 requests per hour. Each process gets a bucket
+# holding the full hour's quota, so a normal run is never slowed down; requests
+# only wait if a single run goes past the quota. Quota shared with other
+# processes or earlier runs shows up as 429s, which the retry policy below
+# handles by sleeping for the server's Retry-After.
+REQUESTS_PER_HOUR = 1000
+
+# Retry policy for transient failures: rate limiting (429) sleeps for the
+# server's Retry-After; 5xx and connection errors back off exponentially
+# (RETRY_BACKOFF_FACTOR * 2 ** attempt seconds)
+MAX_RETRY_ATTEMPTS = 5
+RETRY_BACKOFF_FACTOR = 1.0
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Shared HTTP session for every api.congress.gov call: keep-alive connection
+# pooling (one TLS handshake instead of one per request), JSON responses by
+# default, and urllib3 handling retries. The pool has room for every worker
+# thread the fetch scripts run at once.
+SESSION = requests.Session()
+SESSION.headers.update({"Accept": "application/json", "User-Agent": "policy-watch/1.0"})
+SESSION.params = {"format": "json"}
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=MAX_RETRY_ATTEMPTS,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(["GET"]),
+        respect_retry_after_header=True,
+    ),
+))
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+    
+    Allows bursts of up to `capacity` requests, refilling at `rate` tokens per
+    second. Callers only block once the bucket is empty.
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Take one token, sleeping until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            # Reserve the token now (the balance may go negative) and sleep
+            # outside the lock so other threads can queue up behind us
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+    
+    def __enter__(self):
+        self.acquire()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+RATE_LIMITER = TokenBucket(rate=REQUESTS_PER_HOUR / 3600, capacity=REQUESTS_PER_HOUR)
+
+
+def api_get(url: str, params: Dict, timeout: int = 30, headers: Optional[Dict] = None) -> requests.Response:
+    """GET an api.congress.gov URL through the shared session, within the rate limit."""
+    with RATE_LIMITER:
+        return SESSION.get(url, params=params, timeout=timeout, headers=headers)
@@ -9,26 +9,68 @@ This script:
 - Handles API rate limits and missing fields safely
 """
 import os
+import sys
 import json
-import time
+import itertools
+import mmap
+import threading
+import functools
+import re
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from congress_http import MAX_RETRY_ATTEMPTS, SESSION, api_get
+
+# Try to import orjson for faster JSON encoding/decoding, but fall back to json if not available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
 
 OUTPUT_DIR = Path("src/output")
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 LEGISLATION_FILE = OUTPUT_DIR / "legislation.json"
+# Bill titles fetched from the /titles endpoint, reused across runs
+BILL_TITLES_CACHE_FILE = OUTPUT_DIR / "bill_titles_cache.json"
+# Most entries kept in the titles cache (least recently used are dropped first)
+MAX_TITLES_CACHE_ENTRIES = 20000
 
 # Congress.gov API configuration
 API_BASE_URL = "https://api.congress.gov/v3"
 CONGRESS_NUMBER = 119  # 119th Congress (2025-2026)
 ITEMS_PER_PAGE = 250  # Max allowed by API
 
-# Rate limiting: API allows 1000 requests per hour
-# We'll be conservative and add small delays
-REQUEST_DELAY = 0.1  # 100ms between requests
+# Concurrent requests used for bill list pages and per-bill title lookups
+PAGE_FETCH_WORKERS = 8
+TITLE_FETCH_WORKERS = 8
+
+# Safety limit: don't fetch more than 50 pages (12,500 bills) even if filtering
+MAX_BILL_PAGES = 50
+
+# Maximum stored summary length (characters)
+MAX_SUMMARY_LENGTH = 2000
+
+# Source label shared by every normalized bill
+BILL_SOURCE = sys.intern("Congress.gov API")
+
+# Congress.gov URL slug for each bill type (lowercase type code)
+_BILL_TYPE_URL = {
+    "hr": "house-bill",
+    "s": "senate-bill",
+    "hjres": "house-joint-resolution",
+    "sjres": "senate-joint-resolution",
+    "hconres": "house-concurrent-resolution",
+    "sconres": "senate-concurrent-resolution",
+    "hres": "house-resolution",
+    "sres": "senate-resolution",
+}
 
 
 def get_api_key() -> str:
@@ -50,7 +92,13 @@ def get_api_key() -> str:
     return api_key
 
 
-def fetch_bills_page(api_key: str, congress: int, offset: int = 0, limit: int = ITEMS_PER_PAGE) -> Optional[Dict]:
+def fetch_bills_page(
+    api_key: str,
+    congress: int,
+    offset: int = 0,
+    limit: int = ITEMS_PER_PAGE,
+    from_datetime: Optional[str] = None
+) -> Optional[Dict]:
     """
     Fetch one page of bills from the Congress.gov API.
     
@@ -59,40 +107,153 @@ def fetch_bills_page(api_key: str, congress: int, offset: int = 0, limit: int =
         congress: Congress number (e.g., 119)
         offset: Starting position for pagination
         limit: Number of items per page (max 250)
+        from_datetime: Optional "YYYY-MM-DDTHH:MM:SSZ" lower bound on the bill's
+                       update date, applied server-side (newest updates first)
     
     Returns:
         API response as dict, or None if error
+    
+    Raises:
+        requests.exceptions.HTTPError: if the API rejects from_datetime (400) on
+            the first page; a 400 on a later page is logged and returns None
+            like any other failed page
     """
     url = f"{API_BASE_URL}/bill/{congress}"
     
     params = {
         "api_key": api_key,
-        "format": "json",
         "limit": min(limit, ITEMS_PER_PAGE),  # API max is 250
         "offset": offset
     }
+    if from_datetime:
+        params["fromDateTime"] = from_datetime
+        params["sort"] = "updateDate desc"
     
     try:
-        response = requests.get(url, params=params, timeout=30)
+        response = api_get(url, params, timeout=30)
         response.raise_for_status()
         
-        # Rate limiting: small delay between requests
-        time.sleep(REQUEST_DELAY)
-        
-        return response.json()
+        return _json_loads(response.content)
+    except requests.exceptions.RetryError as e:
+        print(f"Error fetching bills (offset {offset}): gave up after {MAX_RETRY_ATTEMPTS} retries ({e})")
+        return None
     except requests.exceptions.RequestException as e:
+        status_code = getattr(e.response, "status_code", None)
+        if from_datetime and status_code == 400 and offset == 0:
+            # Let the caller fall back to client-side date filtering. Only the
+            # first page is handled that way (iter_bills retries it unfiltered)
+            raise
         print(f"Error fetching bills (offset {offset}): {e}")
-        if hasattr(e.response, 'status_code'):
-            if e.response.status_code == 429:
-                print("Rate limit exceeded. Waiting 60 seconds...")
-                time.sleep(60)
-            elif e.response.status_code == 403:
-                print("API key may be invalid or missing permissions.")
+        if status_code == 403:
+            print("API key may be invalid or missing permissions.")
+        return None
+    except ValueError as e:
+        print(f"Error decoding bills response (offset {offset}): {e}")
         return None
 
 
-# Cache for bill titles to avoid duplicate API calls
-_bill_titles_cache: Dict[str, Dict[str, str]] = {}
+def _load_bill_titles_cache() -> Dict[str, Dict[str, str]]:
+    """Load the persisted bill titles cache, or start empty."""
+    if not BILL_TITLES_CACHE_FILE.exists():
+        return {}
+    
+    try:
+        with open(BILL_TITLES_CACHE_FILE, "rb") as f:
+            data = _json_loads(f.read())
+            if isinstance(data, dict):
+                return dict(list(data.items())[-MAX_TITLES_CACHE_ENTRIES:])
+            print(f"Warning: {BILL_TITLES_CACHE_FILE} has unexpected format.")
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"Warning: Could not load bill titles cache: {e}")
+    return {}
+
+
+def save_bill_titles_cache() -> None:
+    """
+    Persist the bill titles cache so later runs skip the /titles calls.
+    
+    Only lookups that found a title are saved (failed lookups are retried next
+    run), and only the MAX_TITLES_CACHE_ENTRIES most recently used. Written to
+    a temp file and renamed into place so a crash can't leave a truncated
+    cache behind.
+    """
+    found = [(key, titles) for key, titles in _bill_titles_cache.items()
+             if titles.get("official_title") or titles.get("short_title")]
+    found = dict(found[-MAX_TITLES_CACHE_ENTRIES:])
+    payload = orjson.dumps(found) if ORJSON_AVAILABLE else json.dumps(found).encode("utf-8")
+    tmp_file = BILL_TITLES_CACHE_FILE.with_suffix(".json.tmp")
+    with open(tmp_file, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_file, BILL_TITLES_CACHE_FILE)
+
+
+def _titles_cache_key(congress: int, bill_type: str, bill_number: str) -> str:
+    return f"{congress}-{bill_type}-{bill_number}"
+
+
+# Cache for bill titles to avoid duplicate API calls, persisted across runs.
+# Insertion order doubles as recency order: hits are moved to the end.
+# Title fetches run on worker threads, so access goes through the lock.
+_bill_titles_cache: Dict[str, Dict[str, str]] = _load_bill_titles_cache()
+_bill_titles_cache_lock = threading.Lock()
+
+
+def _cached_titles(cache_key: str) -> Optional[Dict[str, str]]:
+    """Return cached titles for a key, marking the entry as recently used."""
+    with _bill_titles_cache_lock:
+        titles = _bill_titles_cache.pop(cache_key, None)
+        if titles is not None:
+            _bill_titles_cache[cache_key] = titles
+    return titles
+
+
+def _cache_titles(cache_key: str, titles: Dict[str, str], replace: bool = True) -> None:
+    """
+    Store titles as the most recently used entry, evicting the least
+    recently used ones beyond MAX_TITLES_CACHE_ENTRIES.
+    
+    With replace=False an existing entry is left as it is.
+    """
+    with _bill_titles_cache_lock:
+        if cache_key in _bill_titles_cache:
+            if not replace:
+                return
+            del _bill_titles_cache[cache_key]
+        _bill_titles_cache[cache_key] = titles
+        while len(_bill_titles_cache) > MAX_TITLES_CACHE_ENTRIES:
+            del _bill_titles_cache[next(iter(_bill_titles_cache))]
+
+
+def _parse_titles(titles: List[Dict]) -> Dict[str, str]:
+    """
+    Pick the official and short titles out of an API titles list.
+    
+    Args:
+        titles: Title entries, each with "titleType" and "title"
+    
+    Returns:
+        Dict with 'short_title' and 'official_title' keys (values may be empty strings)
+    """
+    result = {"short_title": "", "official_title": ""}
+    
+    for title_entry in titles:
+        if not isinstance(title_entry, dict):
+            continue
+        title_type = title_entry.get("titleType", "")
+        title_text = title_entry.get("title", "").strip()
+        
+        if not title_text:
+            continue
+        
+        # Look for Official Title
+        if "Official Title" in title_type and not result["official_title"]:
+            result["official_title"] = title_text
+        
+        # Look for Short Title
+        elif "Short Title" in title_type and not result["short_title"]:
+            result["short_title"] = title_text
+    
+    return result
 
 
 def fetch_bill_titles(api_key: str, congress: int, bill_type: str, bill_number: str) -> Dict[str, str]:
@@ -108,66 +269,65 @@ def fetch_bill_titles(api_key: str, congress: int, bill_type: str, bill_number:
     Returns:
         Dict with 'short_title' and 'official_title' keys (values may be empty strings)
     """
-    cache_key = f"{congress}-{bill_type}-{bill_number}"
+    cache_key = _titles_cache_key(congress, bill_type, bill_number)
     
     # Check cache first
-    if cache_key in _bill_titles_cache:
-        return _bill_titles_cache[cache_key]
+    cached = _cached_titles(cache_key)
+    if cached is not None:
+        return cached
     
     result = {"short_title": "", "official_title": ""}
     
     try:
         url = f"{API_BASE_URL}/bill/{congress}/{bill_type.lower()}/{bill_number}/titles"
-        params = {
-            "api_key": api_key,
-            "format": "json"
-        }
+        params = {"api_key": api_key}
         
-        response = requests.get(url, params=params, timeout=10)
+        response = api_get(url, params, timeout=10)
         response.raise_for_status()
-        time.sleep(REQUEST_DELAY)
         
-        data = response.json()
-        titles = data.get("titles", [])
-        
-        for title_entry in titles:
-            title_type = title_entry.get("titleType", "")
-            title_text = title_entry.get("title", "").strip()
-            
-            if not title_text:
-                continue
-            
-            # Look for Official Title
-            if "Official Title" in title_type and not result["official_title"]:
-                result["official_title"] = title_text
-            
-            # Look for Short Title
-            elif "Short Title" in title_type and not result["short_title"]:
-                result["short_title"] = title_text
+        data = _json_loads(response.content)
+        result = _parse_titles(data.get("titles", []))
         
         # Cache the result
-        _bill_titles_cache[cache_key] = result
+        _cache_titles(cache_key, result)
         return result
         
     except requests.exceptions.Timeout:
         print(f"Timeout fetching titles for {bill_type.upper()} {bill_number}")
-        _bill_titles_cache[cache_key] = result
+        _cache_titles(cache_key, result)
         return result
     except requests.exceptions.RequestException as e:
         # Don't print error for every bill - too noisy
-        _bill_titles_cache[cache_key] = result
+        _cache_titles(cache_key, result)
         return result
     except Exception as e:
-        _bill_titles_cache[cache_key] = result
+        _cache_titles(cache_key, result)
         return result
 
 
+def _apply_titles(bill: Dict, titles: Dict[str, str]) -> bool:
+    """Copy fetched titles onto a bill. Returns True if it gained an official title."""
+    enriched = False
+    if titles["official_title"]:
+        bill["official_title"] = titles["official_title"]
+        enriched = True
+    
+    if titles["short_title"]:
+        bill["short_title"] = titles["short_title"]
+    elif not bill.get("short_title"):
+        # Use display title as fallback for short_title
+        bill["short_title"] = bill.get("title", "")
+    return enriched
+
+
 def enrich_bills_with_titles(api_key: str, bills: List[Dict], max_enrich: int = 50) -> List[Dict]:
     """
     Enrich bills with official_title and short_title from the titles endpoint.
     
     Only enriches bills that don't already have official_title set.
-    Limited to max_enrich bills per run to avoid long execution times.
+    Limited to max_enrich bills per run to avoid long execution times;
+    titles already in the persisted cache don't count against the limit.
+    Titles are fetched concurrently (TITLE_FETCH_WORKERS at a time).
     
     Args:
         api_key: Congress.gov API key
@@ -177,38 +337,52 @@ def enrich_bills_with_titles(api_key: str, bills: List[Dict], max_enrich: int =
     Returns:
         Updated bills list with titles enriched
     """
-    enriched_count = 0
-    skipped_count = 0
-    
+    # Bills with titles seed the cache; the rest are candidates for enrichment
+    missing = []
     for bill in bills:
-        # Only enrich if missing official_title
-        if bill.get("official_title"):
-            continue
-        
-        # Limit enrichment per run
-        if enriched_count >= max_enrich:
-            skipped_count += 1
-            continue
-        
-        congress = bill.get("congress", CONGRESS_NUMBER)
         bill_type = bill.get("bill_type", "")
         bill_number = bill.get("bill_number", "")
-        
         if not bill_type or not bill_number:
             continue
-        
-        # Fetch titles
-        titles = fetch_bill_titles(api_key, congress, bill_type, bill_number)
-        
-        if titles["official_title"]:
-            bill["official_title"] = titles["official_title"]
+        if not bill.get("official_title"):
+            missing.append(bill)
+            continue
+        cache_key = _titles_cache_key(bill.get("congress", CONGRESS_NUMBER), bill_type, bill_number)
+        _cache_titles(cache_key, {
+            "short_title": bill.get("short_title", ""),
+            "official_title": bill["official_title"],
+        }, replace=False)
+    
+    # Titles already known from an earlier run cost no request (or budget)
+    enriched_count = 0
+    uncached = []
+    for bill in missing:
+        cached = _cached_titles(_titles_cache_key(
+            bill.get("congress", CONGRESS_NUMBER), bill["bill_type"], bill["bill_number"]))
+        if cached is None:
+            uncached.append(bill)
+        elif _apply_titles(bill, cached):
             enriched_count += 1
-        
-        if titles["short_title"]:
-            bill["short_title"] = titles["short_title"]
-        elif not bill.get("short_title"):
-            # Use display title as fallback for short_title
-            bill["short_title"] = bill.get("title", "")
+    
+    # Limit enrichment per run; the remainder is picked up by later runs
+    work = uncached[:max_enrich]
+    skipped_count = len(uncached) - len(work)
+    
+    def fetch_titles(bill: Dict) -> Dict[str, str]:
+        congress = bill.get("congress", CONGRESS_NUMBER)
+        return fetch_bill_titles(api_key, congress, bill["bill_type"], bill["bill_number"])
+    
+    # Title lookups are independent network calls, so fetch them concurrently
+    # over the shared session's connection pool
+    with ThreadPoolExecutor(max_workers=TITLE_FETCH_WORKERS) as executor:
+        for bill, titles in zip(work, executor.map(fetch_titles, work)):
+            if _apply_titles(bill, titles):
+                enriched_count += 1
+    
+    try:
+        save_bill_titles_cache()
+    except IOError as e:
+        print(f"Warning: Could not save bill titles cache: {e}")
     
     if enriched_count > 0:
         print(f"Enriched {enriched_count} bills with official titles")
@@ -218,6 +392,40 @@ def enrich_bills_with_titles(api_key: str, bills: List[Dict], max_enrich: int =
     return bills
 
 
+# datetime.fromisoformat() only understands a trailing "Z" from Python 3.11 on
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
+def _iso_timestamp(value: str) -> str:
+    """Re-emit an API date or timestamp in isoformat(); raises ValueError if unparseable."""
+    if not isinstance(value, str):
+        raise ValueError(f"not a date string: {value!r}")
+    return _iso_timestamp_str(value)
+
+
+# Many bills and hearings share the same action or hearing date
+@functools.lru_cache(maxsize=4096)
+def _iso_timestamp_str(value: str) -> str:
+    if not _FROMISOFORMAT_ACCEPTS_Z:
+        value = value.replace("Z", "+00:00")
+    return datetime.fromisoformat(value).isoformat()
+
+
+def _person_name(person: Dict) -> str:
+    """Return a sponsor's fullName, or first and last name when it is absent."""
+    name = person.get("fullName")
+    if name is None:
+        name = person.get("firstName", "") + " " + person.get("lastName", "")
+    return name.strip()
+
+
+def _dict_items(value) -> List[Dict]:
+    """Return the dict entries of an API list field, or [] if it isn't a list."""
+    if not isinstance(value, list):
+        return []
+    return [item for item in value if isinstance(item, dict)]
+
+
 def normalize_bill(bill_data: Dict, congress: int) -> Optional[Dict]:
     """
     Normalize a bill from the API response into our standard format.
@@ -232,29 +440,15 @@ def normalize_bill(bill_data: Dict, congress: int) -> Optional[Dict]:
     try:
         # Extract bill number and type
         bill_number = bill_data.get("number", "")
-        bill_type = bill_data.get("type", "").upper()
+        # Intern the short, highly repeated type codes so every bill shares one object
+        bill_type = sys.intern(bill_data.get("type", "").upper())
         
         # Build Congress.gov URL
         # Format: https://www.congress.gov/bill/{congress}th-congress/{bill-type}/{bill-number}
         bill_type_lower = bill_type.lower()
-        if bill_type_lower == "hr":
-            bill_type_url = "house-bill"
-        elif bill_type_lower == "s":
-            bill_type_url = "senate-bill"
-        elif bill_type_lower == "hjres":
-            bill_type_url = "house-joint-resolution"
-        elif bill_type_lower == "sjres":
-            bill_type_url = "senate-joint-resolution"
-        elif bill_type_lower == "hconres":
-            bill_type_url = "house-concurrent-resolution"
-        elif bill_type_lower == "sconres":
-            bill_type_url = "senate-concurrent-resolution"
-        elif bill_type_lower == "hres":
-            bill_type_url = "house-resolution"
-        elif bill_type_lower == "sres":
-            bill_type_url = "senate-resolution"
-        else:
-            bill_type_url = f"{bill_type_lower}-bill"
+        bill_type_url = _BILL_TYPE_URL.get(bill_type_lower)
+        if bill_type_url is None:
+            bill_type_url = sys.intern(f"{bill_type_lower}-bill")
         
         congress_url = f"{congress}th-congress"
         url = f"https://www.congress.gov/bill/{congress_url}/{bill_type_url}/{bill_number}"
@@ -270,8 +464,8 @@ def normalize_bill(bill_data: Dict, congress: int) -> Optional[Dict]:
         
         # Extract summary (may be in different fields)
         summary = ""
-        if "summary" in bill_data and bill_data["summary"]:
-            summary_text = bill_data["summary"]
+        summary_text = bill_data.get("summary")
+        if summary_text:
             if isinstance(summary_text, str):
                 summary = summary_text.strip()
             elif isinstance(summary_text, dict):
@@ -282,129 +476,105 @@ def normalize_bill(bill_data: Dict, congress: int) -> Optional[Dict]:
         sponsor_party = ""
         sponsor_state = ""
         sponsor_district = ""
-        cosponsors = []
-        
-        if "sponsors" in bill_data and bill_data["sponsors"]:
-            sponsors = bill_data["sponsors"]
-            if isinstance(sponsors, list) and len(sponsors) > 0:
-                sponsor = sponsors[0]
-                if isinstance(sponsor, dict):
-                    sponsor_name = sponsor.get("fullName", sponsor.get("firstName", "") + " " + sponsor.get("lastName", "")).strip()
-                    sponsor_party = sponsor.get("party", "")
-                    sponsor_state = sponsor.get("state", "")
-                    sponsor_district = sponsor.get("district", "")
+        
+        sponsors = bill_data.get("sponsors")
+        if sponsors and isinstance(sponsors, list):
+            sponsor = sponsors[0]
+            if isinstance(sponsor, dict):
+                sponsor_name = _person_name(sponsor)
+                sponsor_party = sponsor.get("party", "")
+                sponsor_state = sponsor.get("state", "")
+                sponsor_district = sponsor.get("district", "")
         
         # Extract cosponsors
-        if "cosponsors" in bill_data and bill_data["cosponsors"]:
-            cosponsors_list = bill_data["cosponsors"]
-            if isinstance(cosponsors_list, list):
-                for cosponsor in cosponsors_list:
-                    if isinstance(cosponsor, dict):
-                        cosp_name = cosponsor.get("fullName", cosponsor.get("firstName", "") + " " + cosponsor.get("lastName", "")).strip()
-                        cosp_party = cosponsor.get("party", "")
-                        cosp_state = cosponsor.get("state", "")
-                        cosponsors.append({
-                            "name": cosp_name,
-                            "party": cosp_party,
-                            "state": cosp_state
-                        })
+        cosponsors = [
+            {
+                "name": _person_name(cosponsor),
+                "party": cosponsor.get("party", ""),
+                "state": cosponsor.get("state", "")
+            }
+            for cosponsor in _dict_items(bill_data.get("cosponsors"))
+        ]
         
         # Extract latest action
         latest_action = ""
         latest_action_date = ""
         
-        if "latestAction" in bill_data and bill_data["latestAction"]:
-            action = bill_data["latestAction"]
+        action = bill_data.get("latestAction")
+        if action:
             if isinstance(action, dict):
                 latest_action = action.get("text", "").strip()
                 action_date = action.get("actionDate", "")
                 if action_date:
                     try:
-                        dt = datetime.fromisoformat(action_date.replace("Z", "+00:00"))
-                        latest_action_date = dt.isoformat()
-                    except (ValueError, AttributeError):
+                        latest_action_date = _iso_timestamp(action_date)
+                    except ValueError:
                         latest_action_date = action_date
         
         # Extract all actions
-        actions = []
-        if "actions" in bill_data and bill_data["actions"]:
-            actions_list = bill_data["actions"]
-            if isinstance(actions_list, list):
-                for action in actions_list:
-                    if isinstance(action, dict):
-                        actions.append({
-                            "text": action.get("text", "").strip(),
-                            "actionDate": action.get("actionDate", ""),
-                            "type": action.get("type", "")
-                        })
+        actions = [
+            {
+                "text": action.get("text", "").strip(),
+                "actionDate": action.get("actionDate", ""),
+                "type": action.get("type", "")
+            }
+            for action in _dict_items(bill_data.get("actions"))
+        ]
         
         # Extract committee information
-        committees = []
-        if "committees" in bill_data and bill_data["committees"]:
-            committees_list = bill_data["committees"]
-            if isinstance(committees_list, list):
-                for committee in committees_list:
-                    if isinstance(committee, dict):
-                        committees.append({
-                            "name": committee.get("name", "").strip(),
-                            "systemCode": committee.get("systemCode", "")
-                        })
+        committees = [
+            {
+                "name": committee.get("name", "").strip(),
+                "systemCode": committee.get("systemCode", "")
+            }
+            for committee in _dict_items(bill_data.get("committees"))
+        ]
         
         # Extract policy areas/subjects
         policy_areas = []
-        if "policyArea" in bill_data and bill_data["policyArea"]:
-            policy_area = bill_data["policyArea"]
-            if isinstance(policy_area, dict):
-                policy_areas.append(policy_area.get("name", "").strip())
-        
-        if "subjects" in bill_data and bill_data["subjects"]:
-            subjects_list = bill_data["subjects"]
-            if isinstance(subjects_list, list):
-                for subject in subjects_list:
-                    if isinstance(subject, dict):
-                        policy_areas.append(subject.get("name", "").strip())
-        
-        # Extract status
-        status = ""
-        if "latestAction" in bill_data and bill_data["latestAction"]:
-            action = bill_data["latestAction"]
-            if isinstance(action, dict):
-                status = action.get("text", "").strip()
+        policy_area = bill_data.get("policyArea")
+        if policy_area and isinstance(policy_area, dict):
+            policy_areas.append(policy_area.get("name", "").strip())
+        
+        policy_areas.extend(
+            subject.get("name", "").strip()
+            for subject in _dict_items(bill_data.get("subjects"))
+        )
+        
+        # Status is the latest action text
+        status = latest_action
         
         # Extract votes information
-        votes = []
-        if "votes" in bill_data and bill_data["votes"]:
-            votes_list = bill_data["votes"]
-            if isinstance(votes_list, list):
-                for vote in votes_list:
-                    if isinstance(vote, dict):
-                        votes.append({
-                            "rollNumber": vote.get("rollNumber", ""),
-                            "chamber": vote.get("chamber", ""),
-                            "date": vote.get("date", ""),
-                            "result": vote.get("result", "")
-                        })
+        votes = [
+            {
+                "rollNumber": vote.get("rollNumber", ""),
+                "chamber": vote.get("chamber", ""),
+                "date": vote.get("date", ""),
+                "result": vote.get("result", "")
+            }
+            for vote in _dict_items(bill_data.get("votes"))
+        ]
         
         # Use introduced date as published date if available
         published_date = latest_action_date
         introduced_date = ""
-        if "introducedDate" in bill_data and bill_data["introducedDate"]:
+        introduced_raw = bill_data.get("introducedDate")
+        if introduced_raw:
             try:
-                dt = datetime.fromisoformat(bill_data["introducedDate"].replace("Z", "+00:00"))
-                published_date = dt.isoformat()
-                introduced_date = dt.isoformat()
-            except (ValueError, AttributeError):
+                introduced_date = _iso_timestamp(introduced_raw)
+                published_date = introduced_date
+            except ValueError:
                 pass
         
         # If no date available, use current time
         if not published_date:
             published_date = datetime.now(timezone.utc).isoformat()
         
-        return {
+        bill = {
             "bill_number": bill_number,
             "bill_type": bill_type,
             "title": title,
-            "summary": summary[:2000] if summary else "",  # Limit summary length
+            "summary": summary if len(summary) <= MAX_SUMMARY_LENGTH else summary[:MAX_SUMMARY_LENGTH],
             "sponsor_name": sponsor_name,
             "sponsor_party": sponsor_party,
             "sponsor_state": sponsor_state,
@@ -420,21 +590,84 @@ def normalize_bill(bill_data: Dict, congress: int) -> Optional[Dict]:
             "introduced_date": introduced_date,
             "url": url,
             "published": published_date,
-            "source": "Congress.gov API",
+            "source": BILL_SOURCE,
             "congress": congress
         }
+        
+        # Some responses embed the titles list; use it so enrichment can skip
+        # the /titles request (the usual shape is just a count and url)
+        titles_list = bill_data.get("titles")
+        if isinstance(titles_list, list):
+            _apply_titles(bill, _parse_titles(titles_list))
+        
+        return bill
     except Exception as e:
         print(f"Error normalizing bill: {e}")
         return None
 
 
-def fetch_all_bills(api_key: str, congress: int, days_back: int = 30) -> List[Dict]:
+def _normalize_page(bills: List[Dict], congress: int) -> List[Dict]:
+    """Normalize one page of raw API bills, dropping any that are invalid."""
+    normalized = (normalize_bill(bill_data, congress) for bill_data in bills)
+    return [bill for bill in normalized if bill]
+
+
+def iter_bill_pages(
+    api_key: str,
+    congress: int,
+    from_datetime: Optional[str] = None,
+    max_pages: int = MAX_BILL_PAGES
+) -> Iterator[Tuple[int, Optional[Dict]]]:
     """
-    Fetch bills from the Congress.gov API with pagination.
+    Yield (page number, response) for each page of /bill/{congress}, in order.
+    
+    The first page is fetched on its own to learn pagination.count. The remaining
+    offsets are then known up front, so they are fetched PAGE_FETCH_WORKERS at a
+    time, costing roughly one round trip per batch instead of one per page.
+    A failed page is yielded as None. Stop iterating to stop fetching.
+    
+    Args:
+        api_key: Congress.gov API key
+        congress: Congress number
+        from_datetime: Optional server-side update-date filter (see fetch_bills_page)
+        max_pages: Safety limit on the number of pages fetched
+    """
+    print(f"Fetching page 1 (offset 0)...")
+    first_page = fetch_bills_page(api_key, congress, 0, ITEMS_PER_PAGE, from_datetime)
+    yield 1, first_page
+    if not first_page:
+        return
+    
+    total_count = first_page.get("pagination", {}).get("count", 0)
+    if total_count > max_pages * ITEMS_PER_PAGE:
+        print(f"  {total_count} bills available; safety limit is {max_pages} pages.")
+    offsets = list(range(ITEMS_PER_PAGE, min(total_count, max_pages * ITEMS_PER_PAGE), ITEMS_PER_PAGE))
+    
+    def fetch_page(offset: int) -> Optional[Dict]:
+        return fetch_bills_page(api_key, congress, offset, ITEMS_PER_PAGE, from_datetime)
+    
+    with ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS) as executor:
+        for i in range(0, len(offsets), PAGE_FETCH_WORKERS):
+            batch = offsets[i:i + PAGE_FETCH_WORKERS]
+            first_page_num = batch[0] // ITEMS_PER_PAGE + 1
+            print(f"Fetching pages {first_page_num}-{first_page_num + len(batch) - 1}...")
+            for offset, response_data in zip(batch, executor.map(fetch_page, batch)):
+                yield offset // ITEMS_PER_PAGE + 1, response_data
+
+
+def iter_bills(api_key: str, congress: int, days_back: int = 30) -> Iterator[Dict]:
+    """
+    Fetch bills from the Congress.gov API with pagination, yielding each
+    normalized bill as its page is processed.
+    
+    Each raw page is released as soon as it has been normalized, so only one
+    page of raw API data is held at a time instead of the whole result set.
     
     Optimized to only fetch bills updated in the last N days to speed up execution.
-    Bills are typically sorted by latest action date, so we can stop early when we
-    encounter old bills.
+    The cutoff is sent to the API as fromDateTime so old bills are never downloaded;
+    bills are still checked against it by latest action date. If the API rejects
+    the filter, every page is fetched and we stop early after several pages of
+    old bills instead.
     
     Args:
         api_key: Congress.gov API key
@@ -442,12 +675,10 @@ def fetch_all_bills(api_key: str, congress: int, days_back: int = 30) -> List[Di
         days_back: Only fetch bills updated in the last N days (default: 30)
                   Set to None or 0 to fetch all bills
     
-    Returns:
-        List of normalized bill dictionaries
+    Yields:
+        Normalized bill dictionaries
     """
-    all_bills = []
-    offset = 0
-    page = 1
+    total_fetched = 0
     
     # Calculate cutoff date for recent bills
     cutoff_date = None
@@ -462,13 +693,25 @@ def fetch_all_bills(api_key: str, congress: int, days_back: int = 30) -> List[Di
     # Track if we've found any recent bills
     recent_bills_found = False
     consecutive_old_bills = 0
-    max_consecutive_old = 3  # Stop after 3 pages of old bills
+    max_consecutive_old = 3  # Stop after 3 pages of old bills (client-side filtering only)
     
-    while True:
-        print(f"Fetching page {page} (offset {offset})...")
-        
-        response_data = fetch_bills_page(api_key, congress, offset, ITEMS_PER_PAGE)
-        
+    # Naive UTC timestamps in isoformat() order lexicographically, so most
+    # action dates can be checked against this string without parsing
+    cutoff_str = cutoff_date.replace(tzinfo=None).isoformat(timespec="seconds") if cutoff_date else ""
+    
+    # Push the date filter to the server when filtering
+    from_datetime = cutoff_date.strftime("%Y-%m-%dT%H:%M:%SZ") if cutoff_date else None
+    pages = iter_bill_pages(api_key, congress, from_datetime)
+    try:
+        first_page = next(pages)
+    except requests.exceptions.HTTPError as e:
+        print(f"  Server-side date filter rejected ({e}); filtering client-side instead")
+        from_datetime = None
+        pages = iter_bill_pages(api_key, congress)
+    else:
+        pages = itertools.chain([first_page], pages)
+    
+    for page, response_data in pages:
         if not response_data:
             print(f"Failed to fetch page {page}. Stopping.")
             break
@@ -482,64 +725,117 @@ def fetch_all_bills(api_key: str, congress: int, days_back: int = 30) -> List[Di
         
         # Normalize and filter bills
         page_recent_count = 0
-        for bill_data in bills:
-            normalized = normalize_bill(bill_data, congress)
-            if normalized:
-                # If we're filtering by date, check if bill is recent
-                if cutoff_date:
-                    # Check latest_action_date or published date
-                    action_date_str = normalized.get("latest_action_date", normalized.get("published", ""))
-                    if action_date_str:
-                        try:
+        for normalized in _normalize_page(bills, congress):
+            # If we're filtering by date, check if bill is recent
+            if cutoff_date:
+                # Check latest_action_date or published date
+                action_date_str = normalized.get("latest_action_date", normalized.get("published", ""))
+                if action_date_str:
+                    try:
+                        if len(action_date_str) == 19 and action_date_str[10] == "T":
+                            # Plain "YYYY-MM-DDTHH:MM:SS" as written by normalize_bill
+                            is_recent = action_date_str >= cutoff_str
+                        else:
                             action_date = datetime.fromisoformat(action_date_str.replace("Z", "+00:00"))
                             if action_date.tzinfo is None:
                                 action_date = action_date.replace(tzinfo=timezone.utc)
-                            
-                            if action_date >= cutoff_date:
-                                all_bills.append(normalized)
-                                page_recent_count += 1
-                                recent_bills_found = True
-                                consecutive_old_bills = 0
-                            else:
-                                consecutive_old_bills += 1
-                        except (ValueError, AttributeError):
-                            # If date parsing fails, include it to be safe
-                            all_bills.append(normalized)
+                            is_recent = action_date >= cutoff_date
+                        
+                        if is_recent:
+                            yield normalized
                             page_recent_count += 1
-                else:
-                    # No date filtering, include all bills
-                    all_bills.append(normalized)
-                    page_recent_count += 1
-        
-        print(f"  Processed {len(bills)} bills from page {page}, {page_recent_count} recent (total: {len(all_bills)})")
+                            recent_bills_found = True
+                            consecutive_old_bills = 0
+                        else:
+                            consecutive_old_bills += 1
+                    except (ValueError, AttributeError):
+                        # If date parsing fails, include it to be safe
+                        yield normalized
+                        page_recent_count += 1
+            else:
+                # No date filtering, include all bills
+                yield normalized
+                page_recent_count += 1
+    
+        total_fetched += page_recent_count
+        print(f"  Processed {len(bills)} bills from page {page}, {page_recent_count} recent (total: {total_fetched})")
         
-        # If filtering by date and we've seen several pages of old bills, we can stop early
-        if cutoff_date and consecutive_old_bills >= len(bills) * max_consecutive_old:
+        # If filtering by date client-side and we've seen several pages of old bills, we can stop early
+        if cutoff_date and not from_datetime and consecutive_old_bills >= len(bills) * max_consecutive_old:
             print(f"  Stopping early: Found {max_consecutive_old} consecutive pages of old bills")
             break
         
-        # Check if there are more pages
-        pagination = response_data.get("pagination", {})
-        total_count = pagination.get("count", 0)
-        offset += len(bills)
-        
-        # Stop if we've fetched all items
-        if offset >= total_count or len(bills) < ITEMS_PER_PAGE:
-            break
-        
-        page += 1
-        
-        # Safety limit: don't fetch more than 50 pages (12,500 bills) even if filtering
-        if page > 50:
-            print(f"  Reached safety limit of 50 pages. Stopping.")
+        # A short page means we've fetched all items
+        if len(bills) < ITEMS_PER_PAGE:
             break
     
-    print(f"\nTotal bills fetched: {len(all_bills)}")
+    print(f"\nTotal bills fetched: {total_fetched}")
     if cutoff_date and not recent_bills_found:
         print(f"Warning: No bills found updated in the last {days_back} days.")
         print("Consider increasing days_back or fetching all bills.")
+
+
+def fetch_all_bills(api_key: str, congress: int, days_back: int = 30) -> List[Dict]:
+    """
+    Fetch bills from the Congress.gov API with pagination.
+    
+    See iter_bills(); this collects its results into a list.
     
-    return all_bills
+    Returns:
+        List of normalized bill dictionaries
+    """
+    return list(iter_bills(api_key, congress, days_back))
+
+
+def _load_json_mapped(path: Path):
+    """
+    Parse a JSON file through a read-only memory map.
+    
+    orjson parses the mapped pages directly, so the file is never copied into
+    an intermediate bytes object first. Raises ValueError on empty or invalid files.
+    """
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            if ORJSON_AVAILABLE:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+            return json.loads(mm[:])
+
+
+def write_json(path: Path, data) -> bool:
+    """
+    Write data as indented JSON, using orjson's C encoder when available.
+    
+    The file is left untouched when it already holds exactly these bytes,
+    so runs that change nothing don't rewrite the whole archive. Otherwise
+    the data goes to a temp file that is synced and then renamed over path,
+    so a crash mid-write leaves the previous file intact instead of a
+    truncated one.
+    
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode("utf-8")
+    
+    try:
+        # Size check first so a changed archive is usually detected without a read
+        if path.stat().st_size == len(payload) and path.read_bytes() == payload:
+            return False
+    except OSError:
+        pass
+    
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return True
 
 
 def load_existing_legislation() -> List[Dict]:
@@ -548,20 +844,32 @@ def load_existing_legislation() -> List[Dict]:
         return []
     
     try:
-        with open(LEGISLATION_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            if isinstance(data, list):
-                return data
-            elif isinstance(data, dict) and "bills" in data:
-                return data["bills"]
-            else:
-                print("Warning: legislation.json has unexpected format.")
-                return []
-    except (json.JSONDecodeError, IOError) as e:
+        data = _load_json_mapped(LEGISLATION_FILE)
+        if isinstance(data, list):
+            return data
+        elif isinstance(data, dict) and "bills" in data:
+            return data["bills"]
+        else:
+            print("Warning: legislation.json has unexpected format.")
+            return []
+    except (ValueError, IOError) as e:
         print(f"Warning: Could not load existing legislation: {e}")
         return []
 
 
+# Enriched fields that an update must not overwrite once they are set
+PRESERVED_BILL_FIELDS = frozenset(["official_title", "short_title"])
+
+
+def _bill_id(bill: Dict) -> Optional[Tuple[str, str]]:
+    """Return the (type, number) merge key for a bill, or None if it has neither."""
+    bill_type = bill.get("bill_type", "")
+    bill_number = bill.get("bill_number", "")
+    if not bill_type and not bill_number:
+        return None
+    return (bill_type, bill_number)
+
+
 def deduplicate_bills(new_bills: List[Dict], existing_bills: List[Dict]) -> List[Dict]:
     """
     Merge new bills with existing bills, updating existing bills if they have newer actions.
@@ -573,11 +881,11 @@ def deduplicate_bills(new_bills: List[Dict], existing_bills: List[Dict]) -> List
     Returns:
         Combined list with updates applied
     """
-    # Create a dict of existing bills indexed by bill_id (type-number)
-    existing_by_id: Dict[str, Dict] = {}
+    # Index existing bills by (type, number); tuple keys skip building a string per bill
+    existing_by_id: Dict[Tuple[str, str], Dict] = {}
     for bill in existing_bills:
-        bill_id = f"{bill.get('bill_type', '')}-{bill.get('bill_number', '')}"
-        if bill_id and bill_id != "-":
+        bill_id = _bill_id(bill)
+        if bill_id:
             existing_by_id[bill_id] = bill
     
     print(f"Indexed {len(existing_by_id)} existing bills for merge")
@@ -587,10 +895,10 @@ def deduplicate_bills(new_bills: List[Dict], existing_bills: List[Dict]) -> List
     unchanged_count = 0
     
     for new_bill in new_bills:
-        bill_id = f"{new_bill.get('bill_type', '')}-{new_bill.get('bill_number', '')}"
+        bill_id = _bill_id(new_bill)
+        existing_bill = existing_by_id.get(bill_id) if bill_id else None
         
-        if bill_id and bill_id != "-" and bill_id in existing_by_id:
-            existing_bill = existing_by_id[bill_id]
+        if existing_bill is not None:
             
             # Check if the new bill has a more recent action date
             new_action_date = new_bill.get("latest_action_date", "")
@@ -598,17 +906,17 @@ def deduplicate_bills(new_bills: List[Dict], existing_bills: List[Dict]) -> List
             
             # Compare dates - update if new is more recent
             if new_action_date and new_action_date > existing_action_date:
-                # Update the existing bill with new data, but preserve enriched fields
-                preserved_fields = ["official_title", "short_title"]
-                for key, value in new_bill.items():
-                    if key not in preserved_fields or not existing_bill.get(key):
-                        existing_bill[key] = value
+                # Update the existing bill in place with new data, but preserve enriched fields
+                existing_bill |= {
+                    key: value for key, value in new_bill.items()
+                    if key not in PRESERVED_BILL_FIELDS or not existing_bill.get(key)
+                }
                 updated_count += 1
             else:
                 unchanged_count += 1
         else:
             # New bill - add to existing
-            if bill_id and bill_id != "-":
+            if bill_id:
                 existing_by_id[bill_id] = new_bill
             new_count += 1
     
@@ -631,56 +939,59 @@ def main():
         print(f"Error: {e}")
         return
     
-    # Load existing legislation
-    existing_bills = load_existing_legislation()
-    print(f"Loaded {len(existing_bills)} existing bills from {LEGISLATION_FILE}")
+    try:
+        # Load existing legislation
+        existing_bills = load_existing_legislation()
+        print(f"Loaded {len(existing_bills)} existing bills from {LEGISLATION_FILE}")
     
-    # Fetch recent bills from API (last 30 days for speed)
-    # Change days_back to None or 0 to fetch all bills
-    DAYS_BACK = 30  # Only fetch bills updated in last 30 days
-    new_bills = fetch_all_bills(api_key, CONGRESS_NUMBER, days_back=DAYS_BACK)
+        # Fetch recent bills from API (last 30 days for speed)
+        # Change days_back to None or 0 to fetch all bills
+        DAYS_BACK = 30  # Only fetch bills updated in last 30 days
+        new_bills = fetch_all_bills(api_key, CONGRESS_NUMBER, days_back=DAYS_BACK)
     
-    if not new_bills:
-        print("No bills fetched. Exiting.")
-        return
+        if not new_bills:
+            print("No bills fetched. Exiting.")
+            return
     
-    # Deduplicate and combine
-    all_bills = deduplicate_bills(new_bills, existing_bills)
+        # Deduplicate and combine
+        all_bills = deduplicate_bills(new_bills, existing_bills)
     
-    # Enrich bills with official titles (limit per run to avoid long execution)
-    print("\nEnriching bills with official titles...")
-    all_bills = enrich_bills_with_titles(api_key, all_bills, max_enrich=500)
+        # Enrich bills with official titles (limit per run to avoid long execution)
+        print("\nEnriching bills with official titles...")
+        all_bills = enrich_bills_with_titles(api_key, all_bills, max_enrich=500)
     
-    # Sort by latest action date (newest first)
-    all_bills.sort(key=lambda x: x.get("latest_action_date", x.get("published", "")), reverse=True)
+        # Sort by latest action date (newest first)
+        all_bills.sort(key=lambda x: x.get("latest_action_date", x.get("published", "")), reverse=True)
     
-    # Save to file
-    try:
-        with open(LEGISLATION_FILE, "w", encoding="utf-8") as f:
-            json.dump(all_bills, f, indent=2)
-        print(f"\nSuccessfully saved {len(all_bills)} bills to {LEGISLATION_FILE}")
-    except Exception as e:
-        print(f"\nError saving legislation: {e}")
-        raise
+        # Save to file
+        try:
+            if write_json(LEGISLATION_FILE, all_bills):
+                print(f"\nSuccessfully saved {len(all_bills)} bills to {LEGISLATION_FILE}")
+            else:
+                print(f"\nNo changes to {len(all_bills)} bills; left {LEGISLATION_FILE} as is")
+        except Exception as e:
+            print(f"\nError saving legislation: {e}")
+            raise
     
-    # Fetch and save federal hearings
-    # Note: Congress.gov API v3 may not have a direct hearings endpoint
-    # This is attempted but may return empty if the API structure doesn't support it
-    try:
-        federal_hearings = fetch_hearings(api_key, CONGRESS_NUMBER)
-        if federal_hearings:
-            HEARINGS_FILE = OUTPUT_DIR / "federal_hearings.json"
-            with open(HEARINGS_FILE, "w", encoding="utf-8") as f:
-                json.dump(federal_hearings, f, indent=2)
-            print(f"\nSuccessfully saved {len(federal_hearings)} federal hearings to {HEARINGS_FILE}")
-        else:
-            print("\nNo federal hearings fetched (API may not support this endpoint).")
-            print("Note: Congress.gov API v3 hearings endpoint structure may differ.")
-            print("Federal hearings feature will be skipped until API structure is confirmed.")
-    except Exception as e:
-        print(f"\nError fetching/saving federal hearings: {e}")
-        print("Note: This is expected if the API doesn't support the hearings endpoint.")
-        # Don't fail the whole script if hearings fail
+        # Fetch and save federal hearings
+        # Note: Congress.gov API v3 may not have a direct hearings endpoint
+        # This is attempted but may return empty if the API structure doesn't support it
+        try:
+            federal_hearings = fetch_hearings(api_key, CONGRESS_NUMBER)
+            if federal_hearings:
+                HEARINGS_FILE = OUTPUT_DIR / "federal_hearings.json"
+                write_json(HEARINGS_FILE, federal_hearings)
+                print(f"\nSuccessfully saved {len(federal_hearings)} federal hearings to {HEARINGS_FILE}")
+            else:
+                print("\nNo federal hearings fetched (API may not support this endpoint).")
+                print("Note: Congress.gov API v3 hearings endpoint structure may differ.")
+                print("Federal hearings feature will be skipped until API structure is confirmed.")
+        except Exception as e:
+            print(f"\nError fetching/saving federal hearings: {e}")
+            print("Note: This is expected if the API doesn't support the hearings endpoint.")
+            # Don't fail the whole script if hearings fail
+    finally:
+        SESSION.close()
 
 
 def fetch_hearings(api_key: str, congress: int) -> List[Dict]:
@@ -702,17 +1013,15 @@ def fetch_hearings(api_key: str, congress: int) -> List[Dict]:
         url = f"{API_BASE_URL}/hearing"
         params = {
             "api_key": api_key,
-            "format": "json",
             "congress": congress,
             "limit": 250,
             "offset": 0
         }
         
-        response = requests.get(url, params=params, timeout=30)
+        response = api_get(url, params, timeout=30)
         response.raise_for_status()
-        time.sleep(REQUEST_DELAY)
         
-        data = response.json()
+        data = _json_loads(response.content)
         hearings_list = data.get("hearings", [])
         
         if hearings_list:
@@ -721,11 +1030,8 @@ def fetch_hearings(api_key: str, congress: int) -> List[Dict]:
             failed_count = 0
             
             for i, hearing_data in enumerate(hearings_list):
-                # Extract chamber from hearing data
-                chamber = hearing_data.get("chamber", "").lower()
-                if not chamber:
-                    # Try to infer from committee or other fields
-                    chamber = "house"  # Default
+                # Chamber from the hearing, else its committee name, else House
+                chamber = _infer_chamber(hearing_data)
                 
                 normalized = normalize_hearing(hearing_data, congress, chamber)
                 if normalized:
@@ -746,33 +1052,14 @@ def fetch_hearings(api_key: str, congress: int) -> List[Dict]:
         else:
             # If bulk fetch doesn't work, try per-chamber
             print("  Bulk fetch returned no results, trying per-chamber...")
+            hearings.extend(fetch_chamber_hearings(api_key, congress))
             
-            # Fetch House committee hearings
-            print("  Fetching House committee hearings...")
-            house_hearings = fetch_committee_hearings(api_key, congress, "house")
-            hearings.extend(house_hearings)
-            
-            # Fetch Senate committee hearings
-            print("  Fetching Senate committee hearings...")
-            senate_hearings = fetch_committee_hearings(api_key, congress, "senate")
-            hearings.extend(senate_hearings)
-            
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, ValueError) as e:
         print(f"  Error with bulk fetch: {e}")
         print("  Trying per-chamber approach...")
         
         # Fallback to per-chamber fetching
-        try:
-            house_hearings = fetch_committee_hearings(api_key, congress, "house")
-            hearings.extend(house_hearings)
-        except Exception as e2:
-            print(f"  Error fetching House hearings: {e2}")
-        
-        try:
-            senate_hearings = fetch_committee_hearings(api_key, congress, "senate")
-            hearings.extend(senate_hearings)
-        except Exception as e2:
-            print(f"  Error fetching Senate hearings: {e2}")
+        hearings.extend(fetch_chamber_hearings(api_key, congress))
     
     if len(hearings) == 0:
         print("No federal hearings fetched.")
@@ -783,10 +1070,70 @@ def fetch_hearings(api_key: str, congress: int) -> List[Dict]:
     return hearings
 
 
+def fetch_chamber_hearings(api_key: str, congress: int) -> List[Dict]:
+    """
+    Fetch House and Senate committee hearings concurrently.
+    
+    The two chambers page through /hearing independently, so they run on
+    separate threads sharing the session's connection pool and rate limit.
+    A failure in one chamber doesn't discard the other's hearings.
+    
+    Args:
+        api_key: Congress.gov API key
+        congress: Congress number
+    
+    Returns:
+        House hearings followed by Senate hearings
+    """
+    chambers = ("house", "senate")
+    print("  Fetching House and Senate committee hearings...")
+    
+    hearings = []
+    with ThreadPoolExecutor(max_workers=len(chambers)) as executor:
+        futures = [
+            executor.submit(fetch_committee_hearings, api_key, congress, chamber)
+            for chamber in chambers
+        ]
+        for chamber, future in zip(chambers, futures):
+            try:
+                hearings.extend(future.result())
+            except Exception as e:
+                print(f"  Error fetching {chamber.capitalize()} hearings: {e}")
+    
+    return hearings
+
+
+def fetch_hearings_page(api_key: str, congress: int, chamber: str, offset: int) -> Dict:
+    """
+    Fetch one page of a chamber's hearings from the /hearing endpoint.
+    
+    Raises:
+        requests.exceptions.RequestException: On network or HTTP errors
+        ValueError: If the response is not valid JSON
+    """
+    url = f"{API_BASE_URL}/hearing"
+    params = {
+        "api_key": api_key,
+        "congress": congress,
+        "chamber": chamber,
+        "limit": 250,
+        "offset": offset
+    }
+    
+    response = api_get(url, params, timeout=30)
+    response.raise_for_status()
+    return _json_loads(response.content)
+
+
 def fetch_committee_hearings(api_key: str, congress: int, chamber: str) -> List[Dict]:
     """
     Fetch hearings for a specific chamber (house or senate) using the /hearing endpoint.
     
+    The first page is fetched on its own to learn pagination.count; the
+    remaining pages are then fetched concurrently and processed in offset order.
+    Requests are retried with backoff by the session (see congress_http.RETRY_STATUS_CODES);
+    a page that still fails is skipped and the remaining pages are kept.
+    
     Args:
         api_key: Congress.gov API key
         congress: Congress number
@@ -796,62 +1143,103 @@ def fetch_committee_hearings(api_key: str, congress: int, chamber: str) -> List[
         List of normalized hearing dictionaries
     """
     hearings = []
-    offset = 0
-    page = 1
     
-    while True:
-        # Use the /hearing endpoint with congress and chamber filters
-        url = f"{API_BASE_URL}/hearing"
-        
-        params = {
-            "api_key": api_key,
-            "format": "json",
-            "congress": congress,
-            "chamber": chamber,
-            "limit": 250,
-            "offset": offset
-        }
-        
-        try:
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            time.sleep(REQUEST_DELAY)
-            
-            data = response.json()
-            hearings_list = data.get("hearings", [])
-            
-            if not hearings_list or len(hearings_list) == 0:
-                break
-            
-            for hearing_data in hearings_list:
-                normalized = normalize_hearing(hearing_data, congress, chamber)
-                if normalized:
-                    hearings.append(normalized)
-            
-            offset += len(hearings_list)
-            
-            # Check pagination
-            pagination = data.get("pagination", {})
-            total_count = pagination.get("count", 0)
-            
-            if offset >= total_count:
+    def add_page(data: Dict) -> int:
+        hearings_list = data.get("hearings", [])
+        hearings.extend(_normalize_hearing_page(hearings_list, congress, chamber))
+        return len(hearings_list)
+    
+    def report_error(offset: int, e: Exception) -> None:
+        print(f"  Error fetching {chamber} hearings (offset {offset}): {e}")
+        if hasattr(e, 'response') and e.response is not None:
+            if e.response.status_code == 404:
+                print(f"  Note: /hearing endpoint may not be available in API v3")
+                print(f"  Trying alternative approach...")
+    
+    try:
+        first_page = fetch_hearings_page(api_key, congress, chamber, 0)
+    except (requests.exceptions.RequestException, ValueError) as e:
+        report_error(0, e)
+        return hearings
+    
+    page_size = add_page(first_page)
+    if not page_size:
+        return hearings
+    
+    # Remaining offsets are known once the total count is
+    total_count = first_page.get("pagination", {}).get("count", 0)
+    offsets = list(range(page_size, total_count, page_size))
+    if not offsets:
+        return hearings
+    
+    def fetch_page(offset: int) -> Dict:
+        return fetch_hearings_page(api_key, congress, chamber, offset)
+    
+    with ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS) as executor:
+        futures = [executor.submit(fetch_page, offset) for offset in offsets]
+        for offset, future in zip(offsets, futures):
+            try:
+                data = future.result()
+            except (requests.exceptions.RequestException, ValueError) as e:
+                # The session has already retried transient errors; skip just
+                # this page rather than dropping every page after it
+                report_error(offset, e)
+                continue
+            if not add_page(data):
                 break
-            
-            page += 1
-            
-        except requests.exceptions.RequestException as e:
-            print(f"  Error fetching {chamber} hearings (offset {offset}): {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                if e.response.status_code == 404:
-                    print(f"  Note: /hearing endpoint may not be available in API v3")
-                    print(f"  Trying alternative approach...")
-                    # Try without chamber filter
-                    break
-            break
     
     return hearings
 
 
+# Field names the hearing endpoints have used for each value, in order of preference
+_HEARING_TITLE_KEYS = ("title", "hearingTitle", "name", "description", "subject")
+_HEARING_DATE_KEYS = ("date", "hearingDate", "scheduledDate", "eventDate",
+                      "startDate", "dateTime", "publishedDate")
+_HEARING_TIME_KEYS = ("time", "hearingTime", "scheduledTime", "eventTime", "startTime")
+_HEARING_LOCATION_KEYS = ("location", "room", "venue")
+_HEARING_URL_KEYS = ("url", "hearingUrl", "link")
+_COMMITTEE_NAME_KEYS = ("name", "fullName", "committeeName", "displayName")
+
+
+def _first_value(data: Dict, keys: Tuple[str, ...], default=""):
+    """Return the first truthy value among data's keys, or default."""
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return default
+
+
+# Chamber named in a committee name, e.g. "House Committee on Agriculture"
+_CHAMBER_RE = re.compile(r"\b(house|senate)\b", re.IGNORECASE)
+
+
+def _committee_name(hearing_data: Dict) -> str:
+    """Return the hearing's committee name from "committee" or the first of "committees", or ""."""
+    committee = hearing_data.get("committee")
+    if not committee:
+        committees_list = hearing_data.get("committees")
+        committee = committees_list[0] if isinstance(committees_list, list) and committees_list else ""
+    if isinstance(committee, dict):
+        committee = _first_value(committee, _COMMITTEE_NAME_KEYS)
+    return committee.strip() if isinstance(committee, str) else ""
+
+
+def _infer_chamber(hearing_data: Dict, default: str = "house") -> str:
+    """Return the hearing's chamber, lowercased, falling back to its committee name, then default."""
+    chamber = hearing_data.get("chamber", "")
+    if chamber:
+        return chamber.lower()
+    match = _CHAMBER_RE.search(_committee_name(hearing_data))
+    return match.group(1).lower() if match else default
+
+
+def _normalize_hearing_page(hearings_list: List[Dict], congress: int, chamber: str) -> List[Dict]:
+    """Normalize one page of raw API hearings, dropping any that are invalid."""
+    normalized = (normalize_hearing(hearing_data, congress, chamber) for hearing_data in hearings_list)
+    return [hearing for hearing in normalized if hearing]
+
+
 def normalize_hearing(hearing_data: Dict, congress: int, chamber: str) -> Optional[Dict]:
     """
     Normalize a hearing from the API response.
@@ -866,25 +1254,16 @@ def normalize_hearing(hearing_data: Dict, congress: int, chamber: str) -> Option
     """
     try:
         # Extract basic information - try multiple field names
-        title = (hearing_data.get("title", "") or 
-                hearing_data.get("hearingTitle", "") or
-                hearing_data.get("name", "") or
-                hearing_data.get("description", "") or
-                hearing_data.get("subject", "")).strip()
+        title = _first_value(hearing_data, _HEARING_TITLE_KEYS).strip()
+        
+        # Committee name from "committee" or the first of "committees"
+        committee_name = _committee_name(hearing_data)
         
         # If still no title, try to construct one from other fields
         if not title:
             # Try to build a title from committee and date
-            committee_part = ""
-            if "committee" in hearing_data:
-                comm = hearing_data["committee"]
-                if isinstance(comm, dict):
-                    committee_part = comm.get("name", "") or comm.get("fullName", "")
-                elif isinstance(comm, str):
-                    committee_part = comm
-            
-            if committee_part:
-                title = f"{committee_part} Hearing"
+            if committee_name:
+                title = f"{committee_name} Hearing"
             else:
                 # Last resort: use a generic title (don't return None - we want to show these)
                 title = "Congressional Hearing"
@@ -899,72 +1278,30 @@ def normalize_hearing(hearing_data: Dict, congress: int, chamber: str) -> Option
         scheduled_time = ""
         
         # Try different possible date fields
-        date_str = (hearing_data.get("date") or 
-                   hearing_data.get("hearingDate") or 
-                   hearing_data.get("scheduledDate") or
-                   hearing_data.get("eventDate") or
-                   hearing_data.get("startDate") or
-                   hearing_data.get("dateTime") or
-                   hearing_data.get("publishedDate"))
+        date_str = _first_value(hearing_data, _HEARING_DATE_KEYS)
         if date_str:
             try:
                 # Handle different date formats
                 if isinstance(date_str, str):
                     # Try ISO format first
-                    dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                    scheduled_date = dt.isoformat()
+                    scheduled_date = _iso_timestamp(date_str)
                 else:
                     scheduled_date = str(date_str)
             except (ValueError, AttributeError):
                 scheduled_date = str(date_str) if date_str else ""
         
         # Try different possible time fields
-        scheduled_time = (hearing_data.get("time") or 
-                         hearing_data.get("hearingTime") or 
-                         hearing_data.get("scheduledTime") or
-                         hearing_data.get("eventTime") or
-                         hearing_data.get("startTime") or "")
+        scheduled_time = _first_value(hearing_data, _HEARING_TIME_KEYS)
         
         # Extract location
-        location = (hearing_data.get("location", "") or 
-                   hearing_data.get("room", "") or
-                   hearing_data.get("venue", ""))
-        
-        # Extract committee information - try multiple structures
-        committee_name = ""
-        
-        # Try committee field (single object)
-        if "committee" in hearing_data:
-            committee = hearing_data["committee"]
-            if isinstance(committee, dict):
-                committee_name = (committee.get("name", "") or 
-                                  committee.get("fullName", "") or
-                                  committee.get("committeeName", "") or
-                                  committee.get("displayName", "")).strip()
-            elif isinstance(committee, str):
-                committee_name = committee.strip()
-        
-        # Try committees field (array)
-        if not committee_name and "committees" in hearing_data:
-            committees_list = hearing_data["committees"]
-            if isinstance(committees_list, list) and len(committees_list) > 0:
-                committee = committees_list[0]
-                if isinstance(committee, dict):
-                    committee_name = (committee.get("name", "") or 
-                                    committee.get("fullName", "") or
-                                    committee.get("committeeName", "") or
-                                    committee.get("displayName", "")).strip()
-                elif isinstance(committee, str):
-                    committee_name = committee.strip()
+        location = _first_value(hearing_data, _HEARING_LOCATION_KEYS)
         
         # Fallback committee name
         if not committee_name:
             committee_name = f"{hearing_chamber.capitalize()} Committee"
         
         # Extract URL
-        url = (hearing_data.get("url", "") or 
-              hearing_data.get("hearingUrl", "") or
-              hearing_data.get("link", ""))
+        url = _first_value(hearing_data, _HEARING_URL_KEYS)
         if not url and "hearingNumber" in hearing_data:
             # Try to build URL from hearing number
             hearing_number = hearing_data.get("hearingNumber", "")
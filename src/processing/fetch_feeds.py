@@ -1,153 +1,462 @@
+"""
+Fetch the federal RSS feeds and merge new items into history.json.
+
+Kansas Legislature feeds are handled by fetch_kansas_rss.py. Everything here
+is driven by run(), so other scripts can reuse the fetch/merge/prune logic for
+their own feeds and files instead of keeping a copy of it.
+"""
 import feedparser
+import functools
+import heapq
 import json
+import operator
+import os
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+# Try to import orjson for faster JSON encoding/decoding, but fall back to json if not available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
 
 OUTPUT_DIR = Path("src/output")
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 ITEMS_FILE = OUTPUT_DIR / "items.json"
 HISTORY_FILE = OUTPUT_DIR / "history.json"
+# ETag / Last-Modified per feed URL, for conditional requests
+FEED_META_FILE = OUTPUT_DIR / "feed_meta.json"
 
 FEEDS = {
     "US Congress": "https://www.congress.gov/rss/notification.xml",
 }
 # Note: Kansas Legislature feeds are handled by fetch_kansas_rss.py
 
-now_utc = datetime.now(timezone.utc)
-# Only fetch new items from feeds that are less than 365 days old
-# But we preserve ALL existing history items regardless of age
-feed_cutoff = now_utc - timedelta(days=365)
-# Minimum retention: keep at least 30 days of history
-min_retention_days = 30
-min_retention_cutoff = now_utc - timedelta(days=min_retention_days)
-
-# Load existing history
-history = []
-if HISTORY_FILE.exists():
+# Sent with every feed request; bot filters often reject the default
+# python-requests User-Agent
+USER_AGENT = "policy-watch/1.0"
+
+# Only fetch new items from feeds that are less than this many days old
+# (existing history items are preserved regardless of age)
+FEED_CUTOFF_DAYS = 365
+# History items older than this are pruned to prevent unbounded growth
+HISTORY_RETENTION_DAYS = 730
+
+# Sort key for history items (every item has "published" once pruned)
+published_key = operator.itemgetter("published")
+
+
+def write_json(path: Path, data) -> None:
+    """
+    Write data as indented JSON, using orjson's C encoder when available.
+    
+    The data goes to a temp file that is synced and then renamed over path,
+    so a crash mid-write leaves the previous file intact instead of a
+    truncated one.
+    """
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    if ORJSON_AVAILABLE:
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            f.flush()
+            os.fsync(f.fileno())
+    else:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_iso(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp; cached since many items share one date string."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def load_history(history_file: Path) -> Optional[List[Dict]]:
+    """
+    Load existing history items.
+    
+    Returns:
+        The history list, or None if the file is missing or unreadable
+        (the caller starts fresh and must write the file)
+    """
+    if not history_file.exists():
+        return None
+    
     try:
-        with open(HISTORY_FILE, "r", encoding="utf-8") as f:
-            loaded_history = json.load(f)
+        with open(history_file, "rb") as f:
+            loaded_history = _json_loads(f.read())
             if isinstance(loaded_history, list):
-                history = loaded_history
-                print(f"Loaded {len(history)} existing history items.")
-            else:
-                print("Warning: history.json is not a list, starting fresh.")
+                print(f"Loaded {len(loaded_history)} existing history items.")
+                return loaded_history
+            print(f"Warning: {history_file.name} is not a list, starting fresh.")
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"Warning: Could not load {history_file.name}: {e}. Starting fresh.")
+    return None
+
+
+def load_feed_meta(meta_file: Path) -> Dict[str, Dict[str, str]]:
+    """Load the validators from the last successful fetch of each feed."""
+    if not meta_file.exists():
+        return {}
+    
+    try:
+        with open(meta_file, "r", encoding="utf-8") as f:
+            loaded_meta = json.load(f)
+            if isinstance(loaded_meta, dict):
+                return loaded_meta
     except (json.JSONDecodeError, IOError) as e:
-        print(f"Warning: Could not load history.json: {e}. Starting fresh.")
+        print(f"Warning: Could not load {meta_file.name}: {e}")
+    return {}
 
-# Index existing items by link for deduplication
-existing_links = {item["link"] for item in history if "link" in item}
-print(f"Found {len(existing_links)} unique items in history.")
 
-# Track initial history count
-initial_count = len(history)
+def fetch_feed(session: requests.Session, url: str, meta: Dict[str, str]):
+    """
+    Download and parse one feed.
+    
+    Args:
+        session: Shared keep-alive session
+        url: Feed URL
+        meta: Saved "etag" / "last_modified" validators for this feed
+    
+    Returns:
+        (response, feed) tuple; feed is None if the feed is unchanged (304)
+    """
+    # Conditional GET: an unchanged feed answers 304 with no body
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    
+    response = session.get(url, headers=headers, timeout=15)
+    if response.status_code == 304:
+        return response, None
+    response.raise_for_status()
+    # Summaries are stored as-is, so skip rewriting relative links in them.
+    # HTML sanitizing stays on: the site's search view renders summaries
+    # through innerHTML.
+    return response, feedparser.parse(response.content, resolve_relative_uris=False)
 
-new_items = []
 
-# Fetch new items from feeds
-for source, url in FEEDS.items():
-    try:
-        feed = feedparser.parse(url)
-        print(f"Fetching from {source}...")
+def fetch_all_feeds(feeds: Dict[str, str], feed_meta: Dict[str, Dict[str, str]]) -> Dict[str, object]:
+    """
+    Fetch all feeds concurrently over one keep-alive session.
+    
+    Args:
+        feeds: Mapping of source name to feed URL
+        feed_meta: Saved validators per feed URL
+    
+    Returns:
+        Mapping of source name to its (response, feed) tuple from fetch_feed,
+        or to the exception raised while fetching it
+    """
+    results = {}
+    with requests.Session() as session:
+        session.headers["User-Agent"] = USER_AGENT
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+        
+        print(f"Fetching {len(feeds)} feeds...")
+        with ThreadPoolExecutor(max_workers=max(len(feeds), 1)) as executor:
+            fetches = {
+                source: executor.submit(fetch_feed, session, url, feed_meta.get(url, {}))
+                for source, url in feeds.items()
+            }
         
-        for entry in feed.entries:
-            published = None
+        for source, future in fetches.items():
+            try:
+                results[source] = future.result()
+            except Exception as e:
+                results[source] = e
+    return results
 
-            if hasattr(entry, "published_parsed") and entry.published_parsed:
-                published = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-            else:
-                published = now_utc
 
-            # Only skip if item is older than feed cutoff (for new items only)
-            if published < feed_cutoff:
-                continue
+def has_feed_content(results: Dict[str, object]) -> bool:
+    """Return True if any fetched feed came back with a body to process."""
+    return any(isinstance(result, tuple) and result[1] is not None for result in results.values())
 
-            link = entry.get("link", "").strip()
-            if not link or link in existing_links:
-                continue
 
-            item = {
-                "title": entry.get("title", "").strip(),
-                "link": link,
-                "summary": entry.get("summary", "")[:2000],
-                "source": source,
-                "published": published.isoformat(),
+def collect_new_items(
+    feeds: Dict[str, str],
+    results: Dict[str, object],
+    history: List[Dict],
+    feed_meta: Dict[str, Dict[str, str]],
+    now_utc: datetime,
+    cutoff_days: int = FEED_CUTOFF_DAYS
+) -> List[Dict]:
+    """
+    Append the unseen entries of each fetched feed to history.
+    
+    feed_meta is updated with the validators of every feed that was fetched
+    and processed successfully.
+    
+    Args:
+        feeds: Mapping of source name to feed URL
+        results: Fetch results from fetch_all_feeds
+        history: Existing history items (new items are appended in place)
+        feed_meta: Saved validators per feed URL (updated in place)
+        now_utc: Current time, used for undated entries
+        cutoff_days: Skip entries older than this many days
+    
+    Returns:
+        The new items, in the order they were appended to history
+    """
+    feed_cutoff = now_utc - timedelta(days=cutoff_days)
+    new_items = []
+    
+    # Index existing items by link for deduplication
+    existing_links = {item["link"] for item in history if "link" in item}
+    print(f"Found {len(existing_links)} unique items in history.")
+    
+    for source, url in feeds.items():
+        try:
+            print(f"Fetching from {source}...")
+            result = results[source]
+            if isinstance(result, Exception):
+                raise result
+            response, feed = result
+            if feed is None:
+                print(f"  {source} not modified since last fetch.")
+                continue
+            
+            for entry in feed.entries:
+                if hasattr(entry, "published_parsed") and entry.published_parsed:
+                    published = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
+                else:
+                    published = now_utc
+                
+                # Only skip if item is older than feed cutoff (for new items only)
+                if published < feed_cutoff:
+                    continue
+                
+                link = entry.get("link", "").strip()
+                if not link or link in existing_links:
+                    continue
+                
+                item = {
+                    "title": entry.get("title", "").strip(),
+                    "link": link,
+                    "summary": entry.get("summary", "")[:2000],
+                    "source": source,
+                    "published": published.isoformat(),
+                }
+                
+                history.append(item)
+                new_items.append(item)
+                existing_links.add(link)
+            
+            # Remember the validators only once the feed has been processed
+            feed_meta[url] = {
+                "etag": response.headers.get("ETag", ""),
+                "last_modified": response.headers.get("Last-Modified", ""),
             }
+        except Exception as e:
+            print(f"Error fetching from {source}: {e}")
+            continue
+    
+    return new_items
+
 
-            history.append(item)
-            new_items.append(item)
-            existing_links.add(link)
-    except Exception as e:
-        print(f"Error fetching from {source}: {e}")
-        continue
-
-# IMPORTANT: Preserve ALL existing history items
-# We only filter VERY old items (older than 2 years) to prevent unbounded growth
-# But we ALWAYS keep at least the last 30 days minimum
-if len(history) > 0:
+def prune_history(history: List[Dict], new_ids: Set[int], now_utc: datetime) -> Tuple[List[Dict], int]:
+    """
+    Drop history items older than HISTORY_RETENTION_DAYS.
+    
+    New items, undated items and items whose date can't be parsed are always
+    kept, and nothing is removed if pruning would drop more than 10% of the
+    existing items. Every item is given a "published" key.
+    
+    Args:
+        history: History items
+        new_ids: id() of each item added this run
+        now_utc: Current time
+    
+    Returns:
+        (history, number of items removed)
+    """
     # Parse dates and filter only items that are VERY old (beyond 2 years)
     # This prevents unbounded growth while preserving recent history
-    two_year_cutoff = now_utc - timedelta(days=730)
+    retention_cutoff = now_utc - timedelta(days=HISTORY_RETENTION_DAYS)
+    # Feed items store published.isoformat() in UTC ("YYYY-MM-DDTHH:MM:SS+00:00");
+    # strings of that shape order like the dates they hold, so they can be
+    # checked against the cutoff without parsing
+    retention_cutoff_str = retention_cutoff.isoformat(timespec="seconds")
     filtered_history = []
     items_removed = 0
     
     for item in history:
         try:
-            # Handle different date formats
-            published_str = item.get("published", "")
+            # Handle different date formats (every item gets a "published"
+            # key here so sorting can use a plain itemgetter)
+            published_str = item.setdefault("published", "")
             if not published_str:
                 # Keep items without dates to be safe
                 filtered_history.append(item)
                 continue
-                
-            item_date = datetime.fromisoformat(published_str.replace("Z", "+00:00"))
+            
+            if len(published_str) == 25 and published_str.endswith("+00:00"):
+                is_recent = published_str >= retention_cutoff_str
+            else:
+                item_date = parse_iso(published_str)
+                is_recent = item_date >= retention_cutoff
             
             # Keep ALL items that are:
             # 1. Within 2 years (generous retention)
             # 2. New items we just added
             # 3. Items we can't parse (to be safe)
-            if item_date >= two_year_cutoff or item in new_items:
+            if is_recent or id(item) in new_ids:
                 filtered_history.append(item)
             else:
                 items_removed += 1
-        except (ValueError, KeyError, AttributeError):
+        except (ValueError, KeyError, AttributeError, TypeError):
             # If we can't parse the date, keep it to be safe
             filtered_history.append(item)
     
     # Only apply filtering if we're not removing too much
     # Safety check: if filtering would remove more than 10% of non-new items, don't filter
-    non_new_items = [item for item in history if item not in new_items]
-    if len(non_new_items) > 0 and items_removed > len(non_new_items) * 0.1:
-        print(f"Warning: Filtering would remove {items_removed} items ({items_removed/len(non_new_items)*100:.1f}%). Keeping all items.")
-        # Don't filter - keep everything
+    non_new_count = len(history) - len(new_ids)
+    if non_new_count > 0 and items_removed > non_new_count * 0.1:
+        print(f"Warning: Filtering would remove {items_removed} items ({items_removed/non_new_count*100:.1f}%). Keeping all items.")
+        return history, 0
+    
+    if items_removed > 0:
+        print(f"Removed {items_removed} very old items (older than 2 years).")
+    return filtered_history, items_removed
+
+
+def merge_new_items(history: List[Dict], new_items: List[Dict], new_ids: Set[int]) -> Tuple[List[Dict], bool]:
+    """
+    Sort history newest first.
+    
+    Every script that writes history.json saves it sorted this way, so the
+    existing items are already one sorted run; only the new items need
+    sorting, and the two runs are merged in linear time.
+    
+    Returns:
+        (sorted history, whether the existing items had to be re-sorted)
+    """
+    existing_history = [item for item in history if id(item) not in new_ids]
+    existing_keys = list(map(published_key, existing_history))
+    reordered = any(prev < cur for prev, cur in zip(existing_keys, existing_keys[1:]))
+    if reordered:
+        # A file edited by hand (or by an older script) - fix the order once
+        existing_history.sort(key=published_key, reverse=True)
+    # Pruning always keeps new items, so they can be sorted directly
+    new_history = sorted(new_items, key=published_key, reverse=True)
+    return list(heapq.merge(existing_history, new_history, key=published_key, reverse=True)), reordered
+
+
+def run(
+    feeds: Dict[str, str],
+    history_file: Path = HISTORY_FILE,
+    items_file: Path = ITEMS_FILE,
+    meta_file: Path = FEED_META_FILE,
+    cutoff_days: int = FEED_CUTOFF_DAYS
+) -> List[Dict]:
+    """
+    Fetch feeds, merge their new items into history and save everything.
+    
+    Args:
+        feeds: Mapping of source name to feed URL
+        history_file: History JSON file to update
+        items_file: File that receives this run's new items
+        meta_file: File holding each feed's ETag / Last-Modified
+        cutoff_days: Skip feed entries older than this many days
+    
+    Returns:
+        The new items added this run
+    """
+    now_utc = datetime.now(timezone.utc)
+    
+    feed_meta = load_feed_meta(meta_file)
+    results = fetch_all_feeds(feeds, feed_meta)
+    
+    # Nothing to merge: leave history untouched rather than loading, pruning
+    # and re-checking the whole file, so a quiet run costs almost nothing.
+    # Pruning simply waits for the next run that brings new content.
+    if history_file.exists() and not has_feed_content(results):
+        for source in feeds:
+            result = results[source]
+            if isinstance(result, Exception):
+                print(f"Error fetching from {source}: {result}")
+            else:
+                print(f"  {source} not modified since last fetch.")
+        print(f"No feed content to merge; {history_file.name} left as is")
+        write_json(items_file, [])
+        print("Added 0 new items.")
+        return []
+    
+    history = load_history(history_file)
+    # Whether history needs rewriting; a missing or unreadable file always does
+    history_changed = history is None
+    if history is None:
+        history = []
+    
+    # Track initial history count
+    initial_count = len(history)
+    
+    new_items = collect_new_items(feeds, results, history, feed_meta, now_utc, cutoff_days)
+    if new_items:
+        history_changed = True
+    
+    # New items are the same dict objects that were appended to history, so
+    # identity is enough to tell them apart in O(1) without comparing dicts
+    new_ids = {id(item) for item in new_items}
+    
+    # IMPORTANT: Preserve ALL existing history items
+    # We only filter VERY old items (older than 2 years) to prevent unbounded growth
+    if history:
+        history, items_removed = prune_history(history, new_ids, now_utc)
+        if items_removed:
+            history_changed = True
+    
+    history, reordered = merge_new_items(history, new_items, new_ids)
+    if reordered:
+        history_changed = True
+    
+    # Validation: Ensure we didn't accidentally lose all history
+    if initial_count > 0 and len(history) < initial_count * 0.1:
+        print(f"ERROR: History count dropped from {initial_count} to {len(history)}!")
+        print("This might indicate a problem. History will be saved but please check.")
+    elif initial_count > len(history):
+        print(f"Note: History reduced from {initial_count} to {len(history)} items (removed very old items).")
+    
+    # Save history (preserving all items); a run that added, removed and
+    # reordered nothing leaves the file as it is instead of rewriting it
+    if history_changed:
+        try:
+            write_json(history_file, history)
+            print(f"Saved {len(history)} total items to {history_file.name}")
+        except Exception as e:
+            print(f"ERROR: Could not save {history_file.name}: {e}")
+            raise
     else:
-        history = filtered_history
-        if items_removed > 0:
-            print(f"Removed {items_removed} very old items (older than 2 years).")
+        print(f"History unchanged ({len(history)} items); {history_file.name} not rewritten")
+    
+    # Save "latest run" items
+    write_json(items_file, new_items)
+    
+    # Save feed validators (only after history is safely written)
+    write_json(meta_file, feed_meta)
+    
+    print(f"Added {len(new_items)} new items.")
+    print(f"Total history items: {len(history)}")
+    return new_items
 
-# Sort newest first
-history.sort(key=lambda x: x.get("published", ""), reverse=True)
 
-# Validation: Ensure we didn't accidentally lose all history
-if initial_count > 0 and len(history) < initial_count * 0.1:
-    print(f"ERROR: History count dropped from {initial_count} to {len(history)}!")
-    print("This might indicate a problem. History will be saved but please check.")
-elif initial_count > len(history):
-    print(f"Note: History reduced from {initial_count} to {len(history)} items (removed very old items).")
+def main():
+    """Fetch the federal feeds into history.json and items.json."""
+    run(FEEDS)
 
-# Save history (preserving all items)
-try:
-    with open(HISTORY_FILE, "w", encoding="utf-8") as f:
-        json.dump(history, f, indent=2)
-    print(f"Saved {len(history)} total items to history.json")
-except Exception as e:
-    print(f"ERROR: Could not save history.json: {e}")
-    raise
-
-# Save "latest run" items
-with open(ITEMS_FILE, "w", encoding="utf-8") as f:
-    json.dump(new_items, f, indent=2)
-
-print(f"Added {len(new_items)} new items.")
-print(f"Total history items: {len(history)}")
+
+if __name__ == "__main__":
+    main()
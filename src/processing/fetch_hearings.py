@@ -10,24 +10,57 @@ This module:
 - Handles API rate limits and missing fields safely
 """
 import os
+import sys
 import json
-import time
+import operator
 import requests
+from urllib.parse import parse_qs, urlsplit
+from concurrent.futures import ThreadPoolExecutor
+import functools
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Set
+
+from congress_http import api_get
+
+# Try to import orjson for faster JSON encoding/decoding, but fall back to json if not available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
 
 OUTPUT_DIR = Path("src/output")
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 HEARINGS_FILE = OUTPUT_DIR / "hearings.json"
+# Normalized meeting/hearing details keyed by detail URL, reused across runs
+# while the list endpoint reports the same updateDate
+DETAIL_CACHE_FILE = OUTPUT_DIR / "hearing_details_cache.json"
 
 # Congress.gov API configuration
 API_BASE_URL = "https://api.congress.gov/v3"
 CONGRESS_NUMBER = 119  # 119th Congress (2025-2026)
 
-# Rate limiting: API allows 1000 requests per hour
-REQUEST_DELAY = 0.1  # 100ms between requests
+# Concurrent requests used for per-meeting and per-hearing detail lookups
+DETAIL_FETCH_WORKERS = 8
+# Details fetched between progress reports / early-stop checks
+DETAIL_BATCH_SIZE = 50
+
+# Public congress.gov page for a committee meeting: format(congress, event_id)
+_EVENT_URL_FMT = "https://www.congress.gov/event/{}th-congress/committee-meeting/{}"
+
+# meetingStatus values (lowercased) that count as scheduled, and location
+# values the API uses as placeholders for "no room"/"no building"
+_SCHEDULED_STATUSES = frozenset(["scheduled", ""])
+_PLACEHOLDER_ROOMS = frozenset(["", "WEBEX"])
+_PLACEHOLDER_BUILDINGS = frozenset(["", "----------"])
+
+# A list page that still fails after retries is skipped; paging stops once
+# this many pages in a row have failed
+MAX_CONSECUTIVE_PAGE_ERRORS = 2
 
 
 def get_api_key() -> str:
@@ -44,6 +77,159 @@ def get_api_key() -> str:
     return api_key
 
 
+def _load_detail_cache() -> Dict[str, Dict]:
+    """Load the persisted detail cache, or start empty."""
+    if not DETAIL_CACHE_FILE.exists():
+        return {}
+    
+    try:
+        with open(DETAIL_CACHE_FILE, "rb") as f:
+            data = _json_loads(f.read())
+            if isinstance(data, dict):
+                return data
+            print(f"Warning: {DETAIL_CACHE_FILE} has unexpected format.")
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"Warning: Could not load detail cache: {e}")
+    return {}
+
+
+# Detail cache entries are {"updateDate": ..., "item": normalized dict}, plus
+# the response's "etag"/"lastModified" validators when the API sent them.
+# Only entries used during this run are saved, so the file tracks the
+# current working set instead of growing forever.
+_detail_cache: Dict[str, Dict] = _load_detail_cache()
+_detail_cache_used: Set[str] = set()
+
+
+def _cache_get(detail_url: str, update_date: str) -> Optional[Dict]:
+    """Return a copy of the cached item for a detail URL if its updateDate still matches."""
+    entry = _detail_cache.get(detail_url)
+    if not update_date or not entry or entry.get("updateDate") != update_date:
+        return None
+    _detail_cache_used.add(detail_url)
+    return dict(entry["item"])
+
+
+def _cache_put(detail_url: str, update_date: str, item: Dict, headers) -> None:
+    """Remember a normalized item under its detail URL, list updateDate and HTTP validators."""
+    entry = {"updateDate": update_date, "item": item}
+    if headers.get("ETag"):
+        entry["etag"] = headers["ETag"]
+    if headers.get("Last-Modified"):
+        entry["lastModified"] = headers["Last-Modified"]
+    if update_date or len(entry) > 2:
+        _detail_cache[detail_url] = entry
+        _detail_cache_used.add(detail_url)
+
+
+def _fetch_detail(
+    api_key: str,
+    detail_url: str,
+    update_date: str,
+    normalize: Callable[[Dict], Optional[Dict]]
+) -> Optional[Dict]:
+    """
+    Get the normalized item for a detail URL, avoiding the download when possible.
+    
+    A cached item whose updateDate matches the list response is returned
+    without a request. Otherwise a cached item is revalidated with
+    If-None-Match/If-Modified-Since, and a 304 reuses it.
+    
+    Args:
+        api_key: Congress.gov API key
+        detail_url: API URL of the meeting or hearing
+        update_date: updateDate from the list response ("" if unknown)
+        normalize: Turns the decoded detail response into an item (or None)
+    
+    Returns:
+        A copy of the normalized item, or None if the record is unusable
+    
+    Raises:
+        requests.exceptions.RequestException: if the request fails
+    """
+    item = _cache_get(detail_url, update_date)
+    if item:
+        return item
+    
+    entry = _detail_cache.get(detail_url)
+    headers = {}
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry and entry.get("lastModified"):
+        headers["If-Modified-Since"] = entry["lastModified"]
+    
+    params = {"api_key": api_key, "format": "json"}
+    response = api_get(detail_url, params, headers=headers)
+    if response.status_code == 304 and headers:
+        item = entry["item"]
+    else:
+        response.raise_for_status()
+        item = normalize(_json_loads(response.content))
+        if not item:
+            return None
+    
+    _cache_put(detail_url, update_date, item, response.headers)
+    return dict(item)
+
+
+def save_detail_cache() -> None:
+    """
+    Persist the detail cache so later runs skip unchanged detail requests.
+    
+    Written to a temp file and renamed into place so a crash can't leave a
+    truncated cache behind.
+    """
+    used = {url: entry for url, entry in _detail_cache.items() if url in _detail_cache_used}
+    payload = orjson.dumps(used) if ORJSON_AVAILABLE else json.dumps(used).encode("utf-8")
+    tmp_file = DETAIL_CACHE_FILE.with_suffix(".json.tmp")
+    with open(tmp_file, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_file, DETAIL_CACHE_FILE)
+
+
+@functools.lru_cache(maxsize=16)
+def _chamber_name(chamber: str) -> str:
+    """Display name for an API chamber value; the handful of distinct values are memoized."""
+    return chamber.capitalize()
+
+
+# datetime.fromisoformat() only accepts a trailing "Z" from Python 3.11 on;
+# on older versions it has to be rewritten as "+00:00" first
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
+def _parse_api_date(date_str: str) -> Optional[datetime]:
+    """Parse an API date ("YYYY-MM-DD" or ISO timestamp, "Z" allowed) as a UTC datetime, or None."""
+    if not date_str or not isinstance(date_str, str):
+        return None
+    try:
+        if "T" in date_str:
+            if not _FROMISOFORMAT_ACCEPTS_Z:
+                date_str = date_str.replace("Z", "+00:00")
+            return datetime.fromisoformat(date_str)
+        return datetime.fromisoformat(date_str + "T00:00:00+00:00")
+    except ValueError:
+        return None
+
+
+def _parse_first_date(dates_array: List) -> Optional[datetime]:
+    """Parse the first entry of a hearing's "dates" array (dicts with "date", or plain strings)."""
+    if not dates_array:
+        return None
+    first_date = dates_array[0]
+    if isinstance(first_date, dict):
+        first_date = first_date.get("date", "")
+    return _parse_api_date(first_date)
+
+
+def _next_offset(next_url: Optional[str]) -> Optional[int]:
+    """Read the offset out of a pagination.next URL, or None if there is no next page."""
+    if not next_url:
+        return None
+    offset = parse_qs(urlsplit(next_url).query).get("offset")
+    return int(offset[0]) if offset else None
+
+
 def fetch_committee_meetings(
     api_key: str,
     congress: int = CONGRESS_NUMBER,
@@ -59,6 +245,9 @@ def fetch_committee_meetings(
     
     This endpoint returns SCHEDULED meetings with status like "Scheduled", "Canceled", etc.
     
+    The first list page gives pagination.count; the remaining pages (up to
+    max_pages) are then fetched concurrently and read in offset order.
+    
     Args:
         api_key: Congress.gov API key
         congress: Congress number (default: 119)
@@ -77,10 +266,11 @@ def fetch_committee_meetings(
     else:
         url = f"{API_BASE_URL}/committee-meeting/{congress}"
     
-    # Calculate date range for filtering (will filter after fetching details)
+    # Calculate date range for filtering (will filter after fetching details).
+    # Kept as "YYYY-MM-DD" strings, which compare in date order without parsing
     now = datetime.now(timezone.utc)
-    start_date = (now - timedelta(days=days_back)).date()
-    end_date = (now + timedelta(days=days_forward)).date()
+    start_date = (now - timedelta(days=days_back)).date().isoformat()
+    end_date = (now + timedelta(days=days_forward)).date().isoformat()
     
     print(f"Fetching committee meetings from Congress.gov API...")
     print(f"  Endpoint: committee-meeting/{congress}")
@@ -88,239 +278,352 @@ def fetch_committee_meetings(
     if chamber:
         print(f"  Chamber: {chamber}")
     
-    # Collect all meeting URLs first (list endpoint doesn't have dates)
+    # Collect all meeting URLs first (list entries usually don't have dates)
     meeting_urls = []
-    current_url = url
-    page = 1
+    out_of_range_count = 0
+    page_size = 250
     max_pages = 20  # Reduced - we'll filter by date after fetching details
     
-    while current_url and page <= max_pages:
-        try:
-            if "?" in current_url:
-                request_url = f"{current_url}&api_key={api_key}&format=json&limit=250"
-            else:
-                request_url = f"{current_url}?api_key={api_key}&format=json&limit=250"
-            
-            print(f"  Fetching page {page}...")
-            response = requests.get(request_url, timeout=30)
-            response.raise_for_status()
-            time.sleep(REQUEST_DELAY)
-            
-            data = response.json()
-            meetings_list = data.get("committeeMeetings", [])
-            
-            if not meetings_list:
-                print(f"  No meetings found on page {page}")
-                break
-            
-            print(f"  Found {len(meetings_list)} meetings on page {page}")
+    def fetch_page(offset: int) -> Dict:
+        params = {"api_key": api_key, "format": "json", "limit": page_size, "offset": offset}
+        response = api_get(url, params)
+        response.raise_for_status()
+        return _json_loads(response.content)
+    
+    def add_page(data: Dict, page: int) -> int:
+        nonlocal out_of_range_count
+        meetings_list = data.get("committeeMeetings", [])
+        if not meetings_list:
+            print(f"  No meetings found on page {page}")
+            return 0
+        
+        print(f"  Found {len(meetings_list)} meetings on page {page}")
+        
+        # Collect URLs for detail fetching
+        for meeting in meetings_list:
+            # When a list entry does carry its date, meetings outside the
+            # window are counted here and never cost a detail request
+            list_dt = _parse_api_date(meeting.get("date", ""))
+            if list_dt and not start_date <= list_dt.date().isoformat() <= end_date:
+                out_of_range_count += 1
+                continue
             
-            # Collect URLs for detail fetching
-            for i, meeting in enumerate(meetings_list):
-                if page == 1 and i == 0:
-                    print(f"  Debug: First meeting keys: {list(meeting.keys())}")
-                
-                detail_url = meeting.get("url", "")
-                event_id = meeting.get("eventId", "")
-                meeting_chamber = meeting.get("chamber", "")
-                
-                if detail_url:
-                    meeting_urls.append({
-                        "url": detail_url,
-                        "event_id": event_id,
-                        "chamber": meeting_chamber
-                    })
+            detail_url = meeting.get("url", "")
+            event_id = meeting.get("eventId", "")
+            meeting_chamber = meeting.get("chamber", "")
             
-            pagination = data.get("pagination", {})
-            current_url = pagination.get("next")
+            if detail_url:
+                meeting_urls.append({
+                    "url": detail_url,
+                    "event_id": event_id,
+                    "chamber": meeting_chamber,
+                    "update_date": meeting.get("updateDate", "")
+                })
+        return len(meetings_list)
+    
+    try:
+        first_page = fetch_page(0)
+    except requests.exceptions.RequestException as e:
+        print(f"  Error fetching meetings (page 1): {e}")
+        first_page = {}
+    except ValueError as e:
+        print(f"  Unexpected error on page 1: {e}")
+        first_page = {}
+    
+    total_count = 0
+    if first_page and add_page(first_page, 1):
+        total_count = first_page.get("pagination", {}).get("count", 0)
+    offsets = list(range(page_size, min(total_count, max_pages * page_size), page_size))
+    page_errors = 0
+    
+    if offsets:
+        with ThreadPoolExecutor(max_workers=DETAIL_FETCH_WORKERS) as executor:
+            futures = [executor.submit(fetch_page, offset) for offset in offsets]
+            for page, future in enumerate(futures, start=2):
+                try:
+                    data = future.result()
+                except requests.exceptions.RequestException as e:
+                    # Retries are exhausted; skip this page rather than dropping every later one
+                    print(f"  Error fetching meetings (page {page}): {e}")
+                    page_errors += 1
+                    if page_errors >= MAX_CONSECUTIVE_PAGE_ERRORS:
+                        print(f"  {page_errors} pages failed in a row, stopping")
+                        break
+                    continue
+                except ValueError as e:
+                    print(f"  Unexpected error on page {page}: {e}")
+                    break
+                page_errors = 0
+                if not add_page(data, page):
+                    break
             
-            if current_url:
-                if "api_key=" in current_url:
-                    current_url = current_url.split("api_key=")[0].rstrip("&?")
-                page += 1
-            else:
-                print(f"  No more pages (reached end)")
-                break
-                
-        except requests.exceptions.RequestException as e:
-            print(f"  Error fetching meetings (page {page}): {e}")
-            break
-        except Exception as e:
-            print(f"  Unexpected error on page {page}: {e}")
-            break
+            # Don't spend requests on pages queued behind a stop
+            for future in futures:
+                future.cancel()
+    elif total_count:
+        print(f"  No more pages (reached end)")
     
     print(f"  Collected {len(meeting_urls)} meeting URLs, fetching details...")
     
-    # Fetch details for each meeting (with date filtering)
+    # Fetch details for each meeting (with date filtering), a batch at a time
+    # so the early-stop check below still bounds the number of requests. Once
+    # a meeting is in range the early stop can no longer trigger, so from then
+    # on the next batch is queued while the current one is read and the
+    # workers don't sit idle behind a batch's slowest request.
     in_range_count = 0
-    out_of_range_count = 0
     error_count = 0
+    processed = 0
     
-    for i, meeting_info in enumerate(meeting_urls):
-        if (i + 1) % 50 == 0:
-            print(f"    Processing {i + 1}/{len(meeting_urls)}... ({in_range_count} in range so far)")
-        
-        detail = fetch_meeting_detail_with_date_filter(
-            api_key, 
-            meeting_info["url"], 
+    def fetch_detail(meeting_info: Dict) -> Optional[Dict]:
+        return fetch_meeting_detail_with_date_filter(
+            api_key,
+            meeting_info["url"],
             meeting_info["event_id"],
             meeting_info["chamber"],
             congress,
             start_date,
-            end_date
+            end_date,
+            meeting_info["update_date"]
         )
+    
+    with ThreadPoolExecutor(max_workers=DETAIL_FETCH_WORKERS) as executor:
+        def submit_batch(start: int) -> List:
+            return [executor.submit(fetch_detail, info) for info in meeting_urls[start:start + DETAIL_BATCH_SIZE]]
         
-        if detail:
-            if detail.get("_in_range"):
-                meetings.append(detail)
-                in_range_count += 1
-            else:
-                out_of_range_count += 1
-        else:
-            error_count += 1
-        
-        # Early stop if we're getting mostly out-of-range meetings
-        # (API returns newest first, so old meetings mean we're past our range)
-        if i > 100 and in_range_count == 0:
-            print(f"    No in-range meetings found in first 100, stopping early")
-            break
+        futures = submit_batch(0)
+        for batch_start in range(0, len(meeting_urls), DETAIL_BATCH_SIZE):
+            if batch_start:
+                print(f"    Processing {batch_start}/{len(meeting_urls)}... ({in_range_count} in range so far)")
+            
+            next_futures = None
+            stop = False
+            for future in futures:
+                if next_futures is None and in_range_count:
+                    next_futures = submit_batch(batch_start + DETAIL_BATCH_SIZE)
+                
+                detail = future.result()
+                processed += 1
+                if detail:
+                    if detail.get("_in_range"):
+                        meetings.append(detail)
+                        in_range_count += 1
+                    else:
+                        out_of_range_count += 1
+                else:
+                    error_count += 1
+                
+                # Early stop if we're getting mostly out-of-range meetings
+                # (API returns newest first, so old meetings mean we're past our range)
+                if processed > 100 and in_range_count == 0:
+                    print(f"    No in-range meetings found in first 100, stopping early")
+                    for pending in futures:
+                        pending.cancel()
+                    stop = True
+                    break
+            
+            if stop:
+                break
+            futures = next_futures if next_futures is not None else submit_batch(batch_start + DETAIL_BATCH_SIZE)
     
     print(f"  Fetched {in_range_count} meetings in date range ({out_of_range_count} out of range, {error_count} errors)")
     return meetings
 
 
+def fetch_chamber_meetings(
+    api_key: str,
+    congress: int = CONGRESS_NUMBER,
+    days_back: int = 30,
+    days_forward: int = 90
+) -> List[Dict]:
+    """
+    Fetch House and Senate committee meetings concurrently.
+    
+    The two chambers page and fetch details independently, so they run on
+    separate threads sharing the session's connection pool and rate limit.
+    A failure in one chamber doesn't discard the other's meetings.
+    
+    Args:
+        api_key: Congress.gov API key
+        congress: Congress number
+        days_back: How many days back to look
+        days_forward: How many days forward to look
+    
+    Returns:
+        House meetings followed by Senate meetings, with internal flags removed
+    """
+    chambers = ("house", "senate")
+    
+    meetings = []
+    with ThreadPoolExecutor(max_workers=len(chambers)) as executor:
+        futures = [
+            executor.submit(fetch_committee_meetings, api_key, congress, chamber, days_back, days_forward)
+            for chamber in chambers
+        ]
+        for chamber, future in zip(chambers, futures):
+            try:
+                chamber_meetings = future.result()
+            except Exception as e:
+                print(f"  Error fetching {chamber} meetings: {e}")
+                continue
+            for meeting in chamber_meetings:
+                meeting.pop("_in_range", None)
+            meetings.extend(chamber_meetings)
+    
+    return meetings
+
+
+def normalize_committee_meeting(
+    meeting_data: Dict,
+    event_id: str,
+    chamber: str,
+    congress: int
+) -> Optional[Dict]:
+    """
+    Normalize a committee meeting record into the CivicWatch schema.
+    
+    Args:
+        meeting_data: The "committeeMeeting" object from a detail response
+        event_id: Meeting event ID, used to build the congress.gov URL
+        chamber: Chamber from the list response, used if the record has none
+        congress: Congress number
+    
+    Returns:
+        Normalized meeting dictionary, or None if the meeting has no usable date
+    """
+    # Extract and parse the date
+    meeting_dt = _parse_api_date(meeting_data.get("date", ""))
+    if not meeting_dt:
+        return None
+    
+    scheduled_date = meeting_dt.date().isoformat()
+    scheduled_time = meeting_dt.strftime("%H:%M") if meeting_dt.time() != datetime.min.time() else ""
+    published = meeting_dt.isoformat()
+    
+    # Extract title
+    title = meeting_data.get("title", "").strip()
+    if not title:
+        title = "Committee Meeting"
+    
+    # Extract meeting type and status
+    meeting_type = meeting_data.get("meetingType", "Meeting")
+    meeting_status = meeting_data.get("meetingStatus", "Scheduled")
+    is_scheduled = meeting_status.lower() in _SCHEDULED_STATUSES
+    meeting_type_lower = meeting_type.lower()
+    
+    # Add status to title if not Scheduled
+    if not is_scheduled:
+        title = f"[{meeting_status.upper()}] {title}"
+    
+    # Extract chamber
+    chamber = _chamber_name(meeting_data.get("chamber", chamber or ""))
+    
+    # Extract committee names
+    committees_list = meeting_data.get("committees", [])
+    committee_names = []
+    for comm in committees_list:
+        if isinstance(comm, dict):
+            name = comm.get("name", "")
+            if name:
+                committee_names.append(name)
+        elif isinstance(comm, str):
+            committee_names.append(comm)
+    committee_str = ", ".join(committee_names) if committee_names else ""
+    
+    # Extract location
+    location_parts = []
+    location_data = meeting_data.get("location", {})
+    if isinstance(location_data, dict):
+        room = location_data.get("room") or ""
+        building = location_data.get("building") or ""
+        if room not in _PLACEHOLDER_ROOMS:
+            location_parts.append(f"Room {room}")
+        if building not in _PLACEHOLDER_BUILDINGS:
+            location_parts.append(building)
+    location = ", ".join(location_parts) if location_parts else ""
+    
+    # Extract associated bills
+    bills = []
+    related_items = meeting_data.get("relatedItems", {})
+    bills_data = related_items.get("bills", [])
+    for bill in bills_data:
+        if isinstance(bill, dict):
+            bill_type = bill.get("type", "")
+            bill_number = bill.get("number", "")
+            if bill_type and bill_number:
+                bills.append(f"{bill_type} {bill_number}")
+    bill_str = ", ".join(bills) if bills else ""
+    
+    # Build URL
+    url = _EVENT_URL_FMT.format(congress, event_id)
+    
+    # Generate summary
+    if is_scheduled:
+        summary = f"Congressional {meeting_type_lower} "
+    else:
+        summary = f"{meeting_status} congressional {meeting_type_lower} "
+    if committee_str:
+        summary += f"before the {committee_str}."
+    else:
+        summary += f"in the {chamber}." if chamber else "scheduled."
+    
+    return {
+        "title": title,
+        "summary": summary,
+        "source": "Federal (US Congress)",
+        "category": "hearing",
+        "chamber": chamber,
+        "committee": committee_names[0] if committee_names else "",
+        "committees": committee_str,
+        "published": published,
+        "scheduled_date": scheduled_date,
+        "scheduled_time": scheduled_time,
+        "url": url,
+        "link": url,
+        "congress": congress,
+        "meeting_type": meeting_type,
+        "meeting_status": meeting_status,
+        "location": location,
+        "bill": bill_str
+    }
+
+
 def fetch_meeting_detail_with_date_filter(
     api_key: str, 
     detail_url: str, 
     event_id: str,
     chamber: str,
     congress: int,
-    start_date,
-    end_date
+    start_date: str,
+    end_date: str,
+    update_date: str = ""
 ) -> Optional[Dict]:
     """
     Fetch full details for a committee meeting and filter by date.
     
+    start_date and end_date are inclusive "YYYY-MM-DD" strings, compared
+    directly against the meeting's scheduled_date. Cached meetings are reused
+    as described in _fetch_detail.
+    
     Returns meeting dict with _in_range=True if in date range, or _in_range=False if not.
     Returns None on error.
     """
+    def normalize(data: Dict) -> Optional[Dict]:
+        return normalize_committee_meeting(data.get("committeeMeeting", data), event_id, chamber, congress)
+    
     try:
-        params = {"api_key": api_key, "format": "json"}
-        response = requests.get(detail_url, params=params, timeout=30)
-        response.raise_for_status()
-        time.sleep(REQUEST_DELAY)
-        
-        data = response.json()
-        meeting_data = data.get("committeeMeeting", data)
-        
-        # Extract date first for filtering
-        meeting_date_str = meeting_data.get("date", "")
-        if not meeting_date_str:
-            return None
-        
-        # Parse the date
-        try:
-            if "T" in meeting_date_str:
-                meeting_dt = datetime.fromisoformat(meeting_date_str.replace("Z", "+00:00"))
-            else:
-                meeting_dt = datetime.fromisoformat(meeting_date_str + "T00:00:00+00:00")
-            
-            meeting_date = meeting_dt.date()
-            scheduled_date = meeting_date.isoformat()
-            scheduled_time = meeting_dt.strftime("%H:%M") if meeting_dt.time() != datetime.min.time() else ""
-            published = meeting_dt.isoformat()
-        except (ValueError, AttributeError):
-            return None
-        
-        # Check date range
-        in_range = start_date <= meeting_date <= end_date
-        
-        # Extract title
-        title = meeting_data.get("title", "").strip()
-        if not title:
-            title = "Committee Meeting"
-        
-        # Extract meeting type and status
-        meeting_type = meeting_data.get("meetingType", "Meeting")
-        meeting_status = meeting_data.get("meetingStatus", "Scheduled")
-        
-        # Add status to title if not Scheduled
-        if meeting_status and meeting_status.lower() not in ["scheduled", ""]:
-            title = f"[{meeting_status.upper()}] {title}"
-        
-        # Extract chamber
-        chamber = meeting_data.get("chamber", chamber or "").capitalize()
-        
-        # Extract committee names
-        committees_list = meeting_data.get("committees", [])
-        committee_names = []
-        for comm in committees_list:
-            if isinstance(comm, dict):
-                name = comm.get("name", "")
-                if name:
-                    committee_names.append(name)
-            elif isinstance(comm, str):
-                committee_names.append(comm)
-        committee_str = ", ".join(committee_names) if committee_names else ""
-        
-        # Extract location
-        location_parts = []
-        location_data = meeting_data.get("location", {})
-        if isinstance(location_data, dict):
-            room = location_data.get("room", "")
-            building = location_data.get("building", "")
-            if room and room != "WEBEX":
-                location_parts.append(f"Room {room}")
-            if building and building != "----------":
-                location_parts.append(building)
-        location = ", ".join(location_parts) if location_parts else ""
-        
-        # Extract associated bills
-        bills = []
-        related_items = meeting_data.get("relatedItems", {})
-        bills_data = related_items.get("bills", [])
-        for bill in bills_data:
-            if isinstance(bill, dict):
-                bill_type = bill.get("type", "")
-                bill_number = bill.get("number", "")
-                if bill_type and bill_number:
-                    bills.append(f"{bill_type} {bill_number}")
-        bill_str = ", ".join(bills) if bills else ""
-        
-        # Build URL
-        url = f"https://www.congress.gov/event/{congress}th-congress/committee-meeting/{event_id}"
-        
-        # Generate summary
-        summary = f"Congressional {meeting_type.lower()} "
-        if meeting_status.lower() not in ["scheduled", ""]:
-            summary = f"{meeting_status} congressional {meeting_type.lower()} "
-        if committee_str:
-            summary += f"before the {committee_str}."
-        else:
-            summary += f"in the {chamber}." if chamber else "scheduled."
-        
-        return {
-            "title": title,
-            "summary": summary,
-            "source": "Federal (US Congress)",
-            "category": "hearing",
-            "chamber": chamber,
-            "committee": committee_names[0] if committee_names else "",
-            "committees": committee_str,
-            "published": published,
-            "scheduled_date": scheduled_date,
-            "scheduled_time": scheduled_time,
-            "url": url,
-            "link": url,
-            "congress": congress,
-            "meeting_type": meeting_type,
-            "meeting_status": meeting_status,
-            "location": location,
-            "bill": bill_str,
-            "_in_range": in_range  # Flag for filtering
-        }
-    except Exception as e:
+        meeting = _fetch_detail(api_key, detail_url, update_date, normalize)
+    except (requests.exceptions.RequestException, ValueError) as e:
+        print(f"    Error fetching meeting {detail_url}: {e}")
+        return None
+    except (KeyError, TypeError, AttributeError) as e:
+        print(f"    Malformed meeting {detail_url}: {e!r}")
+        return None
+    if not meeting:
         return None
+    
+    # Flag for filtering
+    meeting["_in_range"] = start_date <= meeting["scheduled_date"] <= end_date
+    return meeting
 
 
 def fetch_historical_hearings(
@@ -337,10 +640,20 @@ def fetch_historical_hearings(
         congress: Congress number
         days_back: How many days back to fetch
     
+    Detail requests for each page are handed to a thread pool and run while
+    the following list pages are fetched, instead of blocking the pager.
+    
+    A hearing is only published after it is held, so its updateDate is never
+    older than its date; the look-back cutoff is sent to the API as
+    fromDateTime so older hearings are never listed. If the API rejects the
+    filter, or a page shows it was ignored (an updateDate before the cutoff),
+    the list is paged again from the start and filtered client-side instead,
+    stopping at the first page with no hearings in range. Paging never goes
+    past max_pages in either mode.
+    
     Returns:
         List of normalized hearing dictionaries
     """
-    hearings = []
     url = f"{API_BASE_URL}/hearing/{congress}"
     
     now = datetime.now(timezone.utc)
@@ -349,171 +662,247 @@ def fetch_historical_hearings(
     print(f"Fetching historical hearings from /v3/hearing endpoint...")
     print(f"  Looking back {days_back} days from {now.date()}")
     
-    current_url = url
+    page_size = 100
+    base_params = {
+        "api_key": api_key,
+        "format": "json",
+        "limit": page_size,
+        "fromDateTime": f"{start_date.isoformat()}T00:00:00Z",
+        "sort": "updateDate desc"
+    }
+    
+    offset = 0
     page = 1
     max_pages = 20
+    cutoff_iso = start_date.isoformat()
+    page_errors = 0
+    detail_futures = []
+    queued_urls: Set[str] = set()
     
-    while current_url and page <= max_pages:
-        try:
-            if "?" in current_url:
-                request_url = f"{current_url}&api_key={api_key}&format=json&limit=100"
-            else:
-                request_url = f"{current_url}?api_key={api_key}&format=json&limit=100"
-            
-            print(f"  Fetching page {page}...")
-            response = requests.get(request_url, timeout=30)
-            response.raise_for_status()
-            time.sleep(REQUEST_DELAY)
-            
-            data = response.json()
-            hearings_list = data.get("hearings", [])
-            
-            if not hearings_list:
-                break
-            
-            print(f"  Found {len(hearings_list)} hearings on page {page}")
-            
-            in_range_count = 0
-            for hearing_summary in hearings_list:
-                # Check date from list response
-                dates_array = hearing_summary.get("dates", [])
-                if dates_array and len(dates_array) > 0:
-                    first_date = dates_array[0]
-                    if isinstance(first_date, dict):
-                        date_str = first_date.get("date", "")
-                    else:
-                        date_str = str(first_date)
+    with ThreadPoolExecutor(max_workers=DETAIL_FETCH_WORKERS) as executor:
+        while offset is not None and page <= max_pages:
+            try:
+                # Request every page with the same filter so offsets stay consistent
+                params = dict(base_params, offset=offset)
+                
+                response = api_get(url, params)
+                if response.status_code == 400 and page == 1 and "fromDateTime" in base_params:
+                    print(f"  Server-side date filter rejected; filtering client-side instead")
+                    del base_params["fromDateTime"]
+                    del base_params["sort"]
+                    continue
+                response.raise_for_status()
+                
+                data = _json_loads(response.content)
+                hearings_list = data.get("hearings", [])
+                page_errors = 0
+                
+                if not hearings_list:
+                    break
+                
+                print(f"  Found {len(hearings_list)} hearings on page {page}")
+                
+                in_range_count = 0
+                filter_ignored = False
+                detail_entries = []
+                for hearing_summary in hearings_list:
+                    # "YYYY-MM-DD..." strings compare in date order
+                    update_date = hearing_summary.get("updateDate", "")
+                    if update_date and update_date[:10] < cutoff_iso:
+                        filter_ignored = True
                     
-                    if date_str:
-                        try:
-                            if "T" in date_str:
-                                hearing_date = datetime.fromisoformat(date_str.replace("Z", "+00:00")).date()
-                            else:
-                                hearing_date = datetime.fromisoformat(date_str).date()
-                            
-                            if hearing_date < start_date:
-                                continue  # Skip old hearings
-                            
-                            in_range_count += 1
-                        except:
-                            continue
+                    # Check date from list response
+                    dates_array = hearing_summary.get("dates", [])
+                    if dates_array:
+                        hearing_dt = _parse_first_date(dates_array)
+                        if not hearing_dt or hearing_dt.date() < start_date:
+                            continue  # Skip old (or unparseable) hearings
+                        
+                        in_range_count += 1
+                    
+                    # A hearing updated while we page can shift onto a later page too
+                    detail_url = hearing_summary.get("url", "")
+                    if detail_url and detail_url not in queued_urls:
+                        queued_urls.add(detail_url)
+                        detail_entries.append((detail_url, update_date))
                 
-                # Fetch details
-                detail_url = hearing_summary.get("url", "")
-                if detail_url:
-                    normalized = fetch_hearing_detail(api_key, detail_url, congress)
-                    if normalized:
-                        hearings.append(normalized)
-            
-            # Stop if we're getting too many old hearings
-            if in_range_count == 0:
-                print(f"  No hearings in date range on this page, stopping")
+                # Queue this page's details and move on to the next page
+                detail_futures.extend(
+                    executor.submit(fetch_hearing_detail, api_key, detail_url, congress, update_date)
+                    for detail_url, update_date in detail_entries
+                )
+                
+                if filter_ignored and "fromDateTime" in base_params:
+                    # Offsets from the filtered, updateDate-sorted list don't line
+                    # up with the unfiltered one, so page it again from the start
+                    print(f"  Server-side date filter ignored; filtering client-side instead")
+                    del base_params["fromDateTime"]
+                    del base_params["sort"]
+                    offset = 0
+                    page = 1
+                    continue
+                
+                # Without the server-side filter, stop once a page has no recent hearings.
+                # (With it, the list is sorted by updateDate rather than hearing date,
+                # so an all-old page doesn't mean later pages are old too.)
+                if in_range_count == 0 and "fromDateTime" not in base_params:
+                    print(f"  No hearings in date range on this page, stopping")
+                    break
+                
+                pagination = data.get("pagination", {})
+                offset = _next_offset(pagination.get("next"))
+                page += 1
+                
+            except requests.exceptions.RequestException as e:
+                # Retries are exhausted; skip this page rather than dropping every later one
+                print(f"  Error fetching hearings (page {page}): {e}")
+                page_errors += 1
+                if page_errors >= MAX_CONSECUTIVE_PAGE_ERRORS:
+                    print(f"  {page_errors} pages failed in a row, stopping")
+                    break
+                offset += page_size
+                page += 1
+            except Exception as e:
+                print(f"  Error: {e}")
                 break
-            
-            pagination = data.get("pagination", {})
-            current_url = pagination.get("next")
-            if current_url and "api_key=" in current_url:
-                current_url = current_url.split("api_key=")[0].rstrip("&?")
-            page += 1
-            
-        except Exception as e:
-            print(f"  Error: {e}")
-            break
+    
+    # fetch_hearing_detail returns None on any error, so result() won't raise;
+    # futures are read in submission order to keep the API's ordering
+    hearings = [future.result() for future in detail_futures]
+    hearings = [hearing for hearing in hearings if hearing]
     
     print(f"  Fetched {len(hearings)} historical hearings")
     return hearings
 
 
-def fetch_hearing_detail(api_key: str, detail_url: str, congress: int) -> Optional[Dict]:
-    """Fetch and normalize a single hearing detail."""
+def normalize_hearing(hearing_data: Dict, congress: int) -> Optional[Dict]:
+    """
+    Normalize a published hearing record into the CivicWatch schema.
+    
+    Args:
+        hearing_data: The "hearing" object from a detail response
+        congress: Congress number
+    
+    Returns:
+        Normalized hearing dictionary, or None if it has no title or usable date
+    """
+    # Extract title
+    title = hearing_data.get("title", "").strip()
+    if not title:
+        return None
+    
+    # Extract and parse date
+    dt = _parse_first_date(hearing_data.get("dates", []))
+    if not dt:
+        return None
+    
+    scheduled_date = dt.date().isoformat()
+    scheduled_time = dt.strftime("%H:%M") if dt.time() != datetime.min.time() else ""
+    published = dt.isoformat()
+    
+    # Extract chamber and committee
+    chamber = _chamber_name(hearing_data.get("chamber", ""))
+    committees_array = hearing_data.get("committees", [])
+    committee_names = []
+    for comm in committees_array:
+        if isinstance(comm, dict):
+            name = comm.get("name", "")
+            if name:
+                committee_names.append(name)
+    committee_str = ", ".join(committee_names) if committee_names else ""
+    
+    # Build URL from formats or construct one
+    url = ""
+    formats_array = hearing_data.get("formats", [])
+    for fmt in formats_array:
+        if isinstance(fmt, dict):
+            fmt_url = fmt.get("url", "")
+            if fmt_url and "congress.gov" in fmt_url:
+                url = fmt_url
+                break
+    
+    if not url:
+        jacket = hearing_data.get("jacketNumber", "")
+        if jacket:
+            url = f"https://www.congress.gov/hearing/{congress}th-congress/{chamber.lower()}/{jacket}"
+        else:
+            url = "https://www.congress.gov/hearings"
+    
+    summary = f"Congressional hearing before the {committee_str}." if committee_str else "Congressional hearing."
+    
+    return {
+        "title": title,
+        "summary": summary,
+        "source": "Federal (US Congress)",
+        "category": "hearing",
+        "chamber": chamber,
+        "committee": committee_names[0] if committee_names else "",
+        "committees": committee_str,
+        "published": published,
+        "scheduled_date": scheduled_date,
+        "scheduled_time": scheduled_time,
+        "url": url,
+        "link": url,
+        "congress": congress,
+        "meeting_type": "Hearing",
+        "meeting_status": "Completed"
+    }
+
+
+def fetch_hearing_detail(api_key: str, detail_url: str, congress: int, update_date: str = "") -> Optional[Dict]:
+    """Fetch and normalize a single hearing detail, reusing cached copies as described in _fetch_detail."""
     try:
-        params = {"api_key": api_key, "format": "json"}
-        response = requests.get(detail_url, params=params, timeout=30)
-        response.raise_for_status()
-        time.sleep(REQUEST_DELAY)
-        
-        data = response.json()
-        hearing_data = data.get("hearing", data)
-        
-        # Extract title
-        title = hearing_data.get("title", "").strip()
-        if not title:
-            return None
-        
-        # Extract date
-        dates_array = hearing_data.get("dates", [])
-        hearing_date = None
-        if dates_array and len(dates_array) > 0:
-            first_date = dates_array[0]
-            if isinstance(first_date, dict):
-                hearing_date = first_date.get("date")
-            elif isinstance(first_date, str):
-                hearing_date = first_date
-        
-        if not hearing_date:
-            return None
-        
-        # Parse date
-        try:
-            if "T" in hearing_date:
-                dt = datetime.fromisoformat(hearing_date.replace("Z", "+00:00"))
-            else:
-                dt = datetime.fromisoformat(hearing_date + "T00:00:00+00:00")
-            scheduled_date = dt.date().isoformat()
-            scheduled_time = dt.strftime("%H:%M") if dt.time() != datetime.min.time() else ""
-            published = dt.isoformat()
-        except:
-            return None
-        
-        # Extract chamber and committee
-        chamber = hearing_data.get("chamber", "").capitalize()
-        committees_array = hearing_data.get("committees", [])
-        committee_names = []
-        for comm in committees_array:
-            if isinstance(comm, dict):
-                name = comm.get("name", "")
-                if name:
-                    committee_names.append(name)
-        committee_str = ", ".join(committee_names) if committee_names else ""
-        
-        # Build URL from formats or construct one
-        url = ""
-        formats_array = hearing_data.get("formats", [])
-        for fmt in formats_array:
-            if isinstance(fmt, dict):
-                fmt_url = fmt.get("url", "")
-                if fmt_url and "congress.gov" in fmt_url:
-                    url = fmt_url
-                    break
-        
-        if not url:
-            jacket = hearing_data.get("jacketNumber", "")
-            if jacket:
-                url = f"https://www.congress.gov/hearing/{congress}th-congress/{chamber.lower()}/{jacket}"
-            else:
-                url = "https://www.congress.gov/hearings"
-        
-        summary = f"Congressional hearing before the {committee_str}." if committee_str else "Congressional hearing."
-        
-        return {
-            "title": title,
-            "summary": summary,
-            "source": "Federal (US Congress)",
-            "category": "hearing",
-            "chamber": chamber,
-            "committee": committee_names[0] if committee_names else "",
-            "committees": committee_str,
-            "published": published,
-            "scheduled_date": scheduled_date,
-            "scheduled_time": scheduled_time,
-            "url": url,
-            "link": url,
-            "congress": congress,
-            "meeting_type": "Hearing",
-            "meeting_status": "Completed"
-        }
-    except Exception as e:
+        return _fetch_detail(
+            api_key,
+            detail_url,
+            update_date,
+            lambda data: normalize_hearing(data.get("hearing", data), congress)
+        )
+    except (requests.exceptions.RequestException, ValueError) as e:
+        print(f"    Error fetching hearing {detail_url}: {e}")
         return None
+    except (KeyError, TypeError, AttributeError) as e:
+        print(f"    Malformed hearing {detail_url}: {e!r}")
+        return None
+
+
+def _dumps_indented(data) -> bytes:
+    """Encode data as indented JSON, using orjson's C encoder when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def write_hearings_file(path: Path, generated_at: str, items: List[Dict]) -> None:
+    """
+    Write the hearings envelope, encoding one item at a time.
+    
+    Produces the same bytes as encoding the full {generated_at, count,
+    items} dict with indent=2, without holding the whole encoded
+    document in memory alongside the item list. Written to a temp file
+    and renamed into place so a failed run can't leave a truncated
+    hearings.json behind.
+    
+    Args:
+        path: Output file
+        generated_at: ISO timestamp for the envelope
+        items: Hearing/meeting dicts, already sorted
+    """
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(b'{\n  "generated_at": ' + _dumps_indented(generated_at))
+        f.write(b',\n  "count": ' + str(len(items)).encode("ascii"))
+        if items:
+            f.write(b',\n  "items": [')
+            for i, item in enumerate(items):
+                # JSON strings never contain raw newlines, so re-indenting
+                # the item's lines nests it one level deeper
+                f.write((b"\n    " if i == 0 else b",\n    ") +
+                        _dumps_indented(item).replace(b"\n", b"\n    "))
+            f.write(b"\n  ]\n}")
+        else:
+            f.write(b',\n  "items": []\n}')
+    os.replace(tmp_path, path)
 
 
 def load_existing_hearings() -> List[Dict]:
@@ -522,8 +911,8 @@ def load_existing_hearings() -> List[Dict]:
         return []
     
     try:
-        with open(HEARINGS_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(HEARINGS_FILE, "rb") as f:
+            data = _json_loads(f.read())
             if isinstance(data, dict) and "items" in data:
                 return data["items"]
             elif isinstance(data, list):
@@ -535,35 +924,37 @@ def load_existing_hearings() -> List[Dict]:
         return []
 
 
-def merge_and_deduplicate(all_meetings: List[Dict]) -> List[Dict]:
+scheduled_date_key = operator.itemgetter("scheduled_date")
+
+
+def merge_and_deduplicate(all_meetings: List[Dict], min_date: str = "") -> List[Dict]:
     """
     Merge and deduplicate meetings/hearings.
     
     Args:
         all_meetings: Combined list of meetings from all sources
+        min_date: Optional "YYYY-MM-DD"; items scheduled before it are dropped
+                  (undated items are kept)
     
     Returns:
         Deduplicated list sorted by date
     """
-    seen = set()
-    unique = []
+    # First occurrence of each key wins; dict order keeps the input order for ties.
+    # Items without a URL are keyed by a (title, date) tuple, only built when needed
+    unique = {}
     
     for meeting in all_meetings:
-        # Create unique key
-        title = meeting.get("title", "")
-        date = meeting.get("scheduled_date", "")
-        url = meeting.get("url", "")
-        
-        key = url if url else f"{title}_{date}"
-        
-        if key and key not in seen:
-            seen.add(key)
-            unique.append(meeting)
+        # Default the sort key once here so the itemgetter below never raises
+        date = meeting.setdefault("scheduled_date", "")
+        key = meeting.get("url") or (meeting.get("title", ""), date)
+        unique.setdefault(key, meeting)
     
+    # Drop expired items only after deduplication, so an old copy can't stand
+    # in for a dropped one, and before sorting, so they're never compared.
     # Sort by date (newest first for display)
-    unique.sort(key=lambda x: x.get("scheduled_date", ""), reverse=True)
-    
-    return unique
+    kept = [m for m in unique.values() if not m["scheduled_date"] or m["scheduled_date"] >= min_date]
+    kept.sort(key=scheduled_date_key, reverse=True)
+    return kept
 
 
 def main():
@@ -598,14 +989,7 @@ def main():
     # 2. Try per-chamber if no results
     if not all_meetings:
         print("\n  Trying per-chamber fetch...")
-        for chamber_name in ["house", "senate"]:
-            try:
-                meetings = fetch_committee_meetings(api_key, CONGRESS_NUMBER, chamber_name, days_back=30, days_forward=90)
-                for meeting in meetings:
-                    meeting.pop("_in_range", None)
-                all_meetings.extend(meetings)
-            except Exception as e:
-                print(f"  Error fetching {chamber_name} meetings: {e}")
+        all_meetings.extend(fetch_chamber_meetings(api_key, CONGRESS_NUMBER, days_back=30, days_forward=90))
     
     # 2. Fetch historical hearings (published transcripts)
     print("\n[2/2] Fetching historical published hearings...")
@@ -615,24 +999,19 @@ def main():
     except Exception as e:
         print(f"  Error fetching historical hearings: {e}")
     
+    try:
+        save_detail_cache()
+    except IOError as e:
+        print(f"Warning: Could not save detail cache: {e}")
+    
     # Merge and deduplicate
     print("\nMerging and deduplicating...")
-    unique_meetings = merge_and_deduplicate(all_meetings)
-    
-    # Clean up very old items (keep last 2 years)
-    cutoff_date = (datetime.now(timezone.utc) - timedelta(days=730)).date()
-    cleaned = []
-    for meeting in unique_meetings:
-        date_str = meeting.get("scheduled_date", "")
-        if date_str:
-            try:
-                meeting_date = datetime.fromisoformat(date_str).date()
-                if meeting_date >= cutoff_date:
-                    cleaned.append(meeting)
-            except:
-                cleaned.append(meeting)
-        else:
-            cleaned.append(meeting)
+    # Clean up very old items (keep last 2 years) in the same pass.
+    # scheduled_date is always "YYYY-MM-DD" (or empty), so compare it as a string
+    today = datetime.now(timezone.utc).date()
+    today_iso = today.isoformat()
+    cutoff_iso = (today - timedelta(days=730)).isoformat()
+    cleaned = merge_and_deduplicate(all_meetings, min_date=cutoff_iso)
     
     # Summary
     print("\n" + "=" * 60)
@@ -640,29 +1019,22 @@ def main():
     print("=" * 60)
     
     if cleaned:
-        # Count by status/type
-        today = datetime.now(timezone.utc).date()
-        future = [m for m in cleaned if m.get("scheduled_date", "") >= today.isoformat()]
-        past = [m for m in cleaned if m.get("scheduled_date", "") < today.isoformat()]
-        scheduled = [m for m in cleaned if m.get("meeting_status", "").lower() == "scheduled"]
+        # cleaned is sorted newest first, so future items are a prefix of it
+        # and the next upcoming date is the last one in that prefix
+        future_count = next(
+            (i for i, m in enumerate(cleaned) if m["scheduled_date"] < today_iso),
+            len(cleaned)
+        )
         
         print(f"Total hearings/meetings: {len(cleaned)}")
-        print(f"  Future (scheduled): {len(future)}")
-        print(f"  Past (completed): {len(past)}")
+        print(f"  Future (scheduled): {future_count}")
+        print(f"  Past (completed): {len(cleaned) - future_count}")
         
-        if future:
-            future_dates = sorted([m.get("scheduled_date", "") for m in future])
-            print(f"  Next upcoming: {future_dates[0] if future_dates else 'N/A'}")
+        if future_count:
+            print(f"  Next upcoming: {cleaned[future_count - 1]['scheduled_date']}")
         
         # Save to file
-        output = {
-            "generated_at": datetime.now(timezone.utc).isoformat(),
-            "count": len(cleaned),
-            "items": cleaned
-        }
-        
-        with open(HEARINGS_FILE, "w", encoding="utf-8") as f:
-            json.dump(output, f, indent=2)
+        write_hearings_file(HEARINGS_FILE, datetime.now(timezone.utc).isoformat(), cleaned)
         
         print(f"\nSaved {len(cleaned)} items to {HEARINGS_FILE}")
     else: